@@ -0,0 +1,201 @@
+"""Worst-case bus load of a DBC document.
+
+Every message with a cycle time (``GenMsgCycleTime``) occupies the bus for
+``frame bits / bit rate`` once per cycle. Frame bits are the classic CAN worst
+case with maximal bit stuffing, including the 3-bit interframe space, for a
+payload of ``n`` bytes:
+
+- 11-bit identifier: ``47 + 8n + (34 + 8n - 1) // 4``
+- 29-bit identifier: ``67 + 8n + (54 + 8n - 1) // 4``
+
+Messages without a cycle time are event driven and add no load. Payloads
+above 8 bytes are costed at the nominal bit rate, which overstates CAN FD
+frames that switch to a faster data phase.
+
+One document describes one bus; the load is also split per sender node.
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+
+from .model import DbcDocument, MessageModel
+
+DEFAULT_BITRATE = 500_000
+BITRATES = (125_000, 250_000, 500_000, 1_000_000)
+STANDARD_ID_MAX = 0x7FF
+NO_SENDER = "Vector__XXX"
+
+# Edits that cannot change any message's length, cycle time, identifier or sender.
+_NEUTRAL_OPS = {"set_signals", "add_signal", "remove_signal", "move_signals", "rename_prefix"}
+
+
+def frame_bits(length, extended) -> np.ndarray:
+    """Worst-case bits on the wire for payload ``length`` bytes (array-like)."""
+    data = 8 * np.asarray(length, dtype=np.int64)
+    extended = np.asarray(extended, dtype=bool)
+    return np.where(
+        extended,
+        67 + data + (54 + data - 1) // 4,
+        47 + data + (34 + data - 1) // 4,
+    )
+
+
+class LoadEntry(NamedTuple):
+    index: int
+    name: str
+    sender: str
+    cycle_time: Optional[int]
+    bits: int
+    load: float
+
+
+class BusLoadAnalyzer:
+    """Per-message, per-sender and total bus load of a document, kept up to date.
+
+    After :meth:`attach` the analyzer listens to document edits: a changed
+    message only updates its own row and the affected totals, and edits that
+    add, remove or renumber messages recompute all rows in one vectorized pass.
+    """
+
+    def __init__(self, bitrate: int = DEFAULT_BITRATE) -> None:
+        self.doc: Optional[DbcDocument] = None
+        self.bitrate = bitrate
+        self.total = 0.0
+        self._bits = np.zeros(0, dtype=np.int64)
+        self._cycle = np.zeros(0, dtype=np.float64)
+        self._load = np.zeros(0, dtype=np.float64)
+        self._sender_ids = np.zeros(0, dtype=np.int64)
+        self._senders: list[str] = []
+        self._sender_index: dict[str, int] = {}
+        self._sender_load = np.zeros(0, dtype=np.float64)
+
+    def attach(self, doc: DbcDocument) -> None:
+        self.detach()
+        self.doc = doc
+        doc.add_listener(self._on_edit)
+        self.refresh()
+
+    def detach(self) -> None:
+        if self.doc is not None:
+            self.doc.remove_listener(self._on_edit)
+            self.doc = None
+
+    def set_bitrate(self, bitrate: int) -> None:
+        if bitrate <= 0:
+            raise ValueError("bit rate must be positive")
+        self.bitrate = bitrate
+        self.refresh()
+
+    # -- computation -------------------------------------------------------
+
+    def refresh(self) -> None:
+        """Recompute every message from the document."""
+        messages = self.doc.messages if self.doc is not None else []
+        self._senders = []
+        self._sender_index = {}
+        self._sender_ids = np.fromiter(
+            (self._sender_id(message) for message in messages), np.int64, len(messages)
+        )
+        self._bits = frame_bits(
+            [message.length for message in messages],
+            [_is_extended(message) for message in messages],
+        )
+        self._cycle = np.array([message.cycle_time or 0 for message in messages], dtype=np.float64)
+        self._load = self._row_load(self._bits, self._cycle)
+        self._sender_load = np.bincount(
+            self._sender_ids, weights=self._load, minlength=len(self._senders)
+        )
+        self.total = float(self._load.sum())
+
+    def update(self, index: int) -> None:
+        """Recompute one message and apply the difference to the totals."""
+        message = self.doc.messages[index]
+        sender = self._sender_id(message)
+        if sender >= len(self._sender_load):
+            self._sender_load = np.append(self._sender_load, 0.0)
+        bits = int(frame_bits(message.length, _is_extended(message)))
+        cycle = float(message.cycle_time or 0)
+        load = float(self._row_load(bits, cycle))
+
+        self._sender_load[self._sender_ids[index]] -= self._load[index]
+        self._sender_load[sender] += load
+        self.total += load - self._load[index]
+        self._bits[index] = bits
+        self._cycle[index] = cycle
+        self._load[index] = load
+        self._sender_ids[index] = sender
+
+    def what_if(
+        self, index: int, *, length: Optional[int] = None, cycle_time: Optional[int] = None
+    ) -> float:
+        """Bus load if message ``index`` had ``length``/``cycle_time`` (0 = event driven).
+
+        The document and the analyzer are left unchanged.
+        """
+        message = self.doc.messages[index]
+        bits = frame_bits(message.length if length is None else length, _is_extended(message))
+        cycle = float(message.cycle_time or 0) if cycle_time is None else float(cycle_time)
+        return self.total - float(self._load[index]) + float(self._row_load(bits, cycle))
+
+    def _row_load(self, bits, cycle):
+        # Share of the bus: bits per cycle over bits per cycle time (ms -> s).
+        cycle = np.asarray(cycle, dtype=np.float64)
+        return np.divide(
+            np.asarray(bits, dtype=np.float64) * 1000.0,
+            cycle * self.bitrate,
+            out=np.zeros(cycle.shape),
+            where=cycle > 0,
+        )
+
+    def _sender_id(self, message: MessageModel) -> int:
+        sender = message.senders[0] if message.senders else NO_SENDER
+        found = self._sender_index.get(sender)
+        if found is None:
+            found = self._sender_index[sender] = len(self._senders)
+            self._senders.append(sender)
+        return found
+
+    def _on_edit(self, op: str, payload: dict[str, Any]) -> None:
+        if op == "update_message":
+            self.update(payload["index"])
+        elif op not in _NEUTRAL_OPS:
+            self.refresh()
+
+    # -- report ------------------------------------------------------------
+
+    def top_contributors(self, count: int = 10) -> list[LoadEntry]:
+        """The ``count`` messages with the highest load, largest first."""
+        count = min(count, len(self._load))
+        if count <= 0:
+            return []
+        top = np.argpartition(-self._load, count - 1)[:count]
+        top = top[np.argsort(-self._load[top], kind="stable")]
+        messages = self.doc.messages
+        return [
+            LoadEntry(
+                int(idx),
+                messages[idx].name,
+                self._senders[self._sender_ids[idx]],
+                messages[idx].cycle_time,
+                int(self._bits[idx]),
+                float(self._load[idx]),
+            )
+            for idx in top
+        ]
+
+    def sender_loads(self) -> list[tuple[str, float]]:
+        """``(sender, load)`` for every sender node, largest first."""
+        order = np.argsort(-self._sender_load, kind="stable")
+        # Incremental updates can leave rounding residue on senders without load.
+        return [
+            (self._senders[idx], float(self._sender_load[idx]))
+            for idx in order
+            if self._sender_load[idx] > 1e-12
+        ]
+
+
+def _is_extended(message: MessageModel) -> bool:
+    return message.is_extended_frame or message.frame_id > STANDARD_ID_MAX
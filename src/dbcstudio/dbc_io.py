@@ -3,7 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Union
 
-from .model import DbcDocument, MessageModel, SignalModel
+from .model import DbcDocument, DocumentSnapshot, MessageModel, SignalModel, mux_id_ranges
 
 
 def load_dbc(path: str) -> DbcDocument:
@@ -19,6 +19,8 @@ def load_dbc(path: str) -> DbcDocument:
             length=message.length,
             senders=list(message.senders),
             signals=[],
+            cycle_time=message.cycle_time,
+            is_extended_frame=bool(message.is_extended_frame),
         )
         for signal in message.signals:
             converted = SignalModel(
@@ -33,6 +35,11 @@ def load_dbc(path: str) -> DbcDocument:
                 maximum=float(signal.maximum) if signal.maximum is not None else None,
                 unit=signal.unit or "",
                 receivers=list(signal.receivers),
+                is_multiplexer=bool(signal.is_multiplexer),
+                multiplexer_ids=(
+                    list(signal.multiplexer_ids) if signal.multiplexer_ids is not None else None
+                ),
+                multiplexer_signal=signal.multiplexer_signal,
             )
             msg.signals.append(converted)
         messages.append(msg)
@@ -40,7 +47,7 @@ def load_dbc(path: str) -> DbcDocument:
     return DbcDocument(path=path, version=db.version, messages=messages)
 
 
-def save_dbc(doc: DbcDocument, path: str) -> None:
+def save_dbc(doc: Union[DbcDocument, DocumentSnapshot], path: str) -> None:
     lines: list[str] = []
     lines.append('VERSION "{}"'.format(doc.version or ""))
     lines.append("")
@@ -87,9 +94,12 @@ def save_dbc(doc: DbcDocument, path: str) -> None:
     lines.append(f"BU_: {node_text}")
     lines.append("")
 
+    extended_mux: list[str] = []
     for message in doc.messages:
         sender = message.senders[0] if message.senders else "Vector__XXX"
-        lines.append(f"BO_ {message.frame_id} {message.name}: {message.length} {sender}")
+        lines.append(f"BO_ {_dbc_frame_id(message)} {message.name}: {message.length} {sender}")
+        if _needs_extended_mux(message):
+            extended_mux.extend(_mux_value_lines(message))
         for signal in message.signals:
             endian = "1" if signal.byte_order == "little_endian" else "0"
             sign = "-" if signal.is_signed else "+"
@@ -97,9 +107,10 @@ def save_dbc(doc: DbcDocument, path: str) -> None:
             maximum = signal.maximum if signal.maximum is not None else 0
             receivers = ",".join(signal.receivers) if signal.receivers else "Vector__XXX"
             lines.append(
-                " SG_ {name} : {start}|{length}@{endian}{sign} ({scale},{offset}) "
+                " SG_ {name}{mux} : {start}|{length}@{endian}{sign} ({scale},{offset}) "
                 "[{minimum}|{maximum}] \"{unit}\" {receivers}".format(
                     name=signal.name,
+                    mux=_mux_indicator(signal),
                     start=signal.start,
                     length=signal.length,
                     endian=endian,
@@ -114,9 +125,55 @@ def save_dbc(doc: DbcDocument, path: str) -> None:
             )
         lines.append("")
 
+    lines.extend(_cycle_time_lines(doc))
+    lines.extend(extended_mux)
     Path(path).write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
 
 
+def _mux_indicator(signal: SignalModel) -> str:
+    if signal.is_multiplexed:
+        return " m{}{}".format(signal.multiplexer_ids[0], "M" if signal.is_multiplexer else "")
+    return " M" if signal.is_multiplexer else ""
+
+
+def _needs_extended_mux(message: MessageModel) -> bool:
+    multiplexers = [signal for signal in message.signals if signal.is_multiplexer]
+    return len(multiplexers) > 1 or any(
+        signal.is_multiplexed and len(signal.multiplexer_ids) > 1 for signal in message.signals
+    )
+
+
+def _mux_value_lines(message: MessageModel) -> list[str]:
+    default = next((sig.name for sig in message.signals if sig.is_multiplexer), None)
+    lines = []
+    for signal in message.signals:
+        switch = signal.multiplexer_signal or default
+        if not signal.is_multiplexed or switch is None:
+            continue
+        ranges = ", ".join(f"{lo}-{hi}" for lo, hi in mux_id_ranges(signal.multiplexer_ids))
+        lines.append(f"SG_MUL_VAL_ {_dbc_frame_id(message)} {signal.name} {switch} {ranges};")
+    return lines
+
+
+def _dbc_frame_id(message: MessageModel) -> int:
+    # Bit 31 marks a 29-bit identifier in DBC files.
+    return message.frame_id | 0x80000000 if message.is_extended_frame else message.frame_id
+
+
+def _cycle_time_lines(doc: Union[DbcDocument, DocumentSnapshot]) -> list[str]:
+    timed = [message for message in doc.messages if message.cycle_time]
+    if not timed:
+        return []
+    lines = [
+        'BA_DEF_ BO_  "GenMsgCycleTime" INT 0 65535;',
+        'BA_DEF_DEF_  "GenMsgCycleTime" 0;',
+    ]
+    for message in timed:
+        lines.append(f'BA_ "GenMsgCycleTime" BO_ {_dbc_frame_id(message)} {message.cycle_time};')
+    lines.append("")
+    return lines
+
+
 def _fmt(value: Union[float, int]) -> str:
     text = f"{value:.12g}"
     return text
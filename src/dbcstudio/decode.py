@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+from .model import MessageModel, SignalModel
+
+
+class SignalDecoder:
+    """Bit extraction for one signal, with shifts and masks computed up front."""
+
+    __slots__ = ("name", "little_endian", "shift", "mask", "sign_bit", "scale", "offset")
+
+    def __init__(self, signal: SignalModel, frame_size: int) -> None:
+        self.name = signal.name
+        self.little_endian = signal.byte_order == "little_endian"
+        length = max(1, signal.length)
+        if self.little_endian:
+            self.shift = signal.start
+        else:
+            # DBC big-endian start bits name the MSB in sawtooth numbering.
+            msb = (signal.start // 8) * 8 + (7 - signal.start % 8)
+            self.shift = frame_size * 8 - (msb + length)
+        self.mask = (1 << length) - 1
+        self.sign_bit = 1 << (length - 1) if signal.is_signed else 0
+        self.scale = signal.scale
+        self.offset = signal.offset
+
+    def raw(self, little: int, big: int) -> int:
+        value = ((little if self.little_endian else big) >> max(0, self.shift)) & self.mask
+        if self.sign_bit and value & self.sign_bit:
+            value -= self.mask + 1
+        return value
+
+    def physical(self, little: int, big: int) -> float:
+        return self.raw(little, big) * self.scale + self.offset
+
+
+class MessageDecoder:
+    """Decode payloads of one message into physical signal values.
+
+    Multiplexed signals are resolved through a dispatch table built once per
+    message (multiplexer name -> multiplexer value -> active signals), so a
+    payload only costs the signals that are actually present in it. Inactive
+    signals are left out of :meth:`decode` and are NaN in :meth:`decode_array`.
+    """
+
+    def __init__(self, message: MessageModel) -> None:
+        self.frame_id = message.frame_id
+        self.name = message.name
+        self.frame_size = max(1, message.length)
+        self.signals = [SignalDecoder(signal, self.frame_size) for signal in message.signals]
+
+        by_name = {sig.name: sig for sig in self.signals}
+        default = next((sig.name for sig in message.signals if sig.is_multiplexer), None)
+        self.static: list[SignalDecoder] = []
+        self.dispatch: dict[str, dict[int, tuple[SignalDecoder, ...]]] = {}
+        for signal, decoder in zip(message.signals, self.signals):
+            switch = signal.multiplexer_signal or default
+            if not signal.is_multiplexed or switch not in by_name or switch == signal.name:
+                self.static.append(decoder)
+                continue
+            table = self.dispatch.setdefault(switch, {})
+            for value in signal.multiplexer_ids:
+                table[value] = table.get(value, ()) + (decoder,)
+        self._roots = [sig for sig in self.static if sig.name in self.dispatch]
+
+    def decode(self, data: bytes) -> dict[str, float]:
+        little, big = self._words(data)
+        values = {sig.name: sig.physical(little, big) for sig in self.static}
+        pending = list(self._roots)
+        while pending:
+            switch = pending.pop()
+            for sig in self.dispatch[switch.name].get(switch.raw(little, big), ()):
+                values[sig.name] = sig.physical(little, big)
+                if sig.name in self.dispatch:
+                    pending.append(sig)
+        return values
+
+    def decode_array(self, payloads):
+        """Vectorized :meth:`decode` over an ``(N, frame_size)`` uint8 array."""
+        import numpy as np
+
+        count = len(payloads)
+        if self.frame_size > 8:
+            rows = [self.decode(bytes(row)) for row in payloads]
+            return {
+                sig.name: np.fromiter(
+                    (row.get(sig.name, np.nan) for row in rows), np.float64, count
+                )
+                for sig in self.signals
+            }
+        padded = np.zeros((count, 8), dtype=np.uint8)
+        padded[:, : self.frame_size] = payloads
+        little = padded.view("<u8").ravel()
+        big = padded.view(">u8").ravel() >> np.uint64(8 * (8 - self.frame_size))
+
+        def raw(sig: SignalDecoder, rows=slice(None)):
+            word = little[rows] if sig.little_endian else big[rows]
+            value = (word >> np.uint64(max(0, sig.shift))) & np.uint64(sig.mask)
+            if sig.sign_bit:
+                # Sign-extend by moving the sign bit to bit 63 and shifting back
+                # arithmetically; exact for every length up to 64 bits.
+                unused = np.uint64(64 - sig.mask.bit_length())
+                value = (value << unused).view(np.int64) >> unused.astype(np.int64)
+            return value
+
+        result = {sig.name: raw(sig) * sig.scale + sig.offset for sig in self.static}
+        if not self.dispatch:
+            return result
+        for sig in self.signals:
+            result.setdefault(sig.name, np.full(count, np.nan))
+        pending = [(sig, np.arange(count)) for sig in self._roots]
+        while pending:
+            switch, rows = pending.pop()
+            switch_values = raw(switch, rows)
+            for value, active in self.dispatch[switch.name].items():
+                selected = rows[switch_values == value]
+                if not len(selected):
+                    continue
+                for sig in active:
+                    result[sig.name][selected] = raw(sig, selected) * sig.scale + sig.offset
+                    if sig.name in self.dispatch:
+                        pending.append((sig, selected))
+        return result
+
+    def _words(self, data: bytes) -> tuple[int, int]:
+        size = self.frame_size
+        if len(data) != size:
+            data = bytes(data[:size]).ljust(size, b"\0")
+        return int.from_bytes(data, "little"), int.from_bytes(data, "big")
+
+
+def decode_key(message: MessageModel) -> tuple:
+    """Hashable summary of the fields of ``message`` that change its decoded values."""
+    return (
+        message.frame_id,
+        message.length,
+        tuple(
+            (
+                sig.name,
+                sig.start,
+                sig.length,
+                sig.byte_order,
+                sig.is_signed,
+                sig.scale,
+                sig.offset,
+                sig.is_multiplexer,
+                tuple(sig.multiplexer_ids) if sig.is_multiplexed else None,
+                sig.multiplexer_signal,
+            )
+            for sig in message.signals
+        ),
+    )
+
+
+def build_decoders(messages: Iterable[MessageModel]) -> dict[int, MessageDecoder]:
+    decoders: dict[int, MessageDecoder] = {}
+    for message in messages:
+        decoders.setdefault(message.frame_id, MessageDecoder(message))
+    return decoders
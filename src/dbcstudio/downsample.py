@@ -0,0 +1,145 @@
+"""Multi-resolution min/max pyramid for plotting very long signals."""
+
+from __future__ import annotations
+
+import threading
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from .export import CHUNK_LINES, ProgressCallback, iter_decoded_chunks
+from .model import MessageModel
+
+PYRAMID_FACTOR = 8
+
+
+class PlotColumns(NamedTuple):
+    """Samples to draw: ``x`` in data time, one min/max pair per entry.
+
+    ``raw`` is true when ``ymin``/``ymax`` are the original samples, which
+    should be joined by a polyline rather than drawn as vertical spans.
+    """
+
+    x: np.ndarray
+    ymin: np.ndarray
+    ymax: np.ndarray
+    raw: bool
+
+
+class MinMaxPyramid:
+    """Min/max envelopes of a sampled signal at ``factor**k`` samples per bucket.
+
+    Level 0 is the raw data. Every level keeps the time of the first sample of
+    each bucket, so a query for any time window and pixel width touches
+    roughly ``factor * pixels`` buckets whatever the signal length.
+
+    NaN samples (e.g. multiplexed signals absent from a frame) are dropped.
+    """
+
+    def __init__(self, t: np.ndarray, y: np.ndarray, factor: int = PYRAMID_FACTOR) -> None:
+        t = np.ascontiguousarray(t, dtype=np.float64)
+        y = np.ascontiguousarray(y, dtype=np.float64)
+        if t.shape != y.shape or t.ndim != 1:
+            raise ValueError("time and value arrays must be 1-D with equal length")
+        present = ~np.isnan(y)
+        if not present.all():
+            t, y = t[present], y[present]
+        self.factor = factor
+        self.t = t
+        self.y = y
+        # (bucket size, bucket start times, mins, maxs) per level above raw.
+        self.levels: list[tuple[int, np.ndarray, np.ndarray, np.ndarray]] = []
+        size, starts, mins, maxs = 1, t, y, y
+        while len(mins) > factor:
+            size *= factor
+            starts = starts[::factor]
+            mins = _reduce(np.fmin, mins, factor)
+            maxs = _reduce(np.fmax, maxs, factor)
+            self.levels.append((size, starts, mins, maxs))
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    @property
+    def nbytes(self) -> int:
+        # Bucket start times are strided views into ``t``.
+        levels = sum(mins.nbytes + maxs.nbytes for _, _, mins, maxs in self.levels)
+        return self.t.nbytes + self.y.nbytes + levels
+
+    @property
+    def time_range(self) -> tuple[float, float]:
+        if not len(self.t):
+            return 0.0, 0.0
+        return float(self.t[0]), float(self.t[-1])
+
+    def query(self, t0: float, t1: float, pixels: int) -> PlotColumns:
+        """Return at most ``pixels`` min/max columns covering ``t0..t1``."""
+        pixels = max(1, int(pixels))
+        lo, hi = np.searchsorted(self.t, [t0, t1], side="left")
+        # One sample on each side keeps lines running to the viewport edges.
+        lo = max(0, int(lo) - 1)
+        hi = min(len(self.t), int(hi) + 1)
+        if hi - lo <= 2 * pixels:
+            y = self.y[lo:hi]
+            return PlotColumns(self.t[lo:hi], y, y, True)
+
+        starts, mins, maxs = self.t, self.y, self.y
+        first, last = lo, hi
+        for size, level_starts, level_mins, level_maxs in self.levels:
+            if (hi - lo) // size < 2 * pixels:
+                break
+            starts, mins, maxs = level_starts, level_mins, level_maxs
+            first, last = lo // size, -(-hi // size)
+
+        starts = starts[first:last]
+        span = t1 - t0 if t1 > t0 else 1.0
+        cols = np.clip(((starts - t0) * (pixels / span)).astype(np.int64), 0, pixels - 1)
+        edges = np.concatenate(([0], np.flatnonzero(np.diff(cols)) + 1))
+        return PlotColumns(
+            t0 + (cols[edges] + 0.5) * (span / pixels),
+            np.fmin.reduceat(mins[first:last], edges),
+            np.fmax.reduceat(maxs[first:last], edges),
+            False,
+        )
+
+
+def read_signal_pyramid(
+    trace_path: str,
+    message: MessageModel,
+    signal_name: str,
+    workers: int = 0,
+    cancel: Optional[threading.Event] = None,
+    progress: Optional[ProgressCallback] = None,
+    chunk_lines: int = CHUNK_LINES,
+) -> Optional[MinMaxPyramid]:
+    """Decode one signal of ``message`` from a trace and build its pyramid.
+
+    The trace is decoded in chunks (see :func:`~dbcstudio.export.iter_decoded_chunks`)
+    and only the requested column is kept. Returns ``None`` if ``cancel`` is set
+    before the trace has been read.
+    """
+    stamps: list[np.ndarray] = []
+    values: list[np.ndarray] = []
+    chunks = iter_decoded_chunks(trace_path, [message], chunk_lines, workers, progress)
+    try:
+        for chunk in chunks:
+            if cancel is not None and cancel.is_set():
+                return None
+            for _name, _signals, t, columns in chunk:
+                y = columns[signal_name]
+                present = ~np.isnan(y)
+                stamps.append(t[present])
+                values.append(y[present])
+    finally:
+        chunks.close()
+    if not stamps:
+        return MinMaxPyramid(np.zeros(0), np.zeros(0))
+    return MinMaxPyramid(np.concatenate(stamps), np.concatenate(values))
+
+
+def _reduce(op: np.ufunc, values: np.ndarray, factor: int) -> np.ndarray:
+    full = len(values) // factor * factor
+    out = op.reduce(values[:full].reshape(-1, factor), axis=1)
+    if full < len(values):
+        out = np.append(out, op.reduce(values[full:]))
+    return out
@@ -0,0 +1,265 @@
+"""Streaming export of decoded signals from large traces.
+
+The trace is read in chunks of lines; each chunk is parsed and decoded
+(optionally in a process pool, results consumed in submission order) and its
+columns appended to the output. Only a bounded number of chunks is ever in
+memory, whatever the trace size.
+
+Outputs:
+
+- ``csv``: a directory with one ``<Message>.csv`` per message
+  (``timestamp`` followed by one column per signal).
+- ``npz``: a NumPy archive with ``<Message>.timestamp`` and
+  ``<Message>.<Signal>`` arrays. Columns are spooled to temporary files and
+  streamed into the archive at the end.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import zipfile
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .decode import MessageDecoder, build_decoders
+from .model import DbcDocument, DocumentSnapshot, MessageModel
+from .trace import parse_candump_line
+
+CHUNK_LINES = 65536
+EXPORT_FORMATS = ("csv", "npz")
+
+ProgressCallback = Callable[[int, int], None]
+# (message name, signal names, timestamps, values per signal) for each message in a chunk.
+DecodedChunk = List[Tuple[str, List[str], np.ndarray, Dict[str, np.ndarray]]]
+
+
+class ExportError(Exception):
+    pass
+
+
+def export_signals(
+    doc: Union[DbcDocument, DocumentSnapshot],
+    trace_path: str,
+    out_path: str,
+    fmt: str = "csv",
+    messages: Optional[Iterable[str]] = None,
+    chunk_lines: int = CHUNK_LINES,
+    workers: int = 0,
+    progress: Optional[ProgressCallback] = None,
+) -> dict[str, int]:
+    """Decode ``trace_path`` with the messages of ``doc`` and write them to ``out_path``.
+
+    ``messages`` limits the export to the given message names. With
+    ``workers > 1`` chunks are decoded in a (spawned) process pool. ``progress`` is
+    called with ``(bytes read, total bytes)`` after every chunk. Returns the
+    number of rows written per message. Messages that share a frame ID cannot be
+    told apart in a trace and raise ``ExportError``; select one of them with
+    ``messages``.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ExportError(f"unknown export format {fmt!r}")
+    wanted = set(messages) if messages is not None else None
+    selected = [m for m in doc.messages if wanted is None or m.name in wanted]
+    if not selected:
+        raise ExportError("no messages to export")
+    _check_frame_ids(selected)
+
+    writer = _CsvWriter(out_path) if fmt == "csv" else _NpzWriter(out_path)
+    rows: dict[str, int] = {}
+    try:
+        for chunk in iter_decoded_chunks(trace_path, selected, chunk_lines, workers, progress):
+            for name, signal_names, stamps, values in chunk:
+                writer.write(name, signal_names, stamps, values)
+                rows[name] = rows.get(name, 0) + len(stamps)
+        writer.close()
+    except BaseException:
+        writer.abort()
+        raise
+    return rows
+
+
+def iter_decoded_chunks(
+    trace_path: str,
+    messages: list[MessageModel],
+    chunk_lines: int = CHUNK_LINES,
+    workers: int = 0,
+    progress: Optional[ProgressCallback] = None,
+) -> Iterator[DecodedChunk]:
+    """Decode ``trace_path`` chunk by chunk with ``messages``, in trace order.
+
+    ``progress`` is called with ``(bytes read, total bytes)`` after every chunk
+    has been consumed. Closing the iterator early stops reading the trace.
+    """
+    _check_frame_ids(messages)
+    total = os.path.getsize(trace_path)
+    done = 0
+    with open(trace_path, encoding="ascii", errors="replace") as handle:
+        for size, chunk in _decoded_chunks(handle, messages, chunk_lines, workers):
+            yield chunk
+            done += size
+            if progress is not None:
+                progress(min(done, total), total)
+
+
+def decode_lines(lines: list[str], decoders: dict[int, MessageDecoder]) -> DecodedChunk:
+    """Parse candump ``lines`` and decode them, grouped per message in first-seen order."""
+    grouped: dict[int, tuple[array, bytearray]] = {}
+    for line in lines:
+        frame = parse_candump_line(line)
+        if frame is None:
+            continue
+        decoder = decoders.get(frame.frame_id)
+        if decoder is None:
+            continue
+        entry = grouped.get(frame.frame_id)
+        if entry is None:
+            entry = grouped[frame.frame_id] = (array("d"), bytearray())
+        size = decoder.frame_size
+        data = frame.data
+        entry[0].append(frame.timestamp)
+        entry[1].extend(data if len(data) == size else data[:size].ljust(size, b"\0"))
+
+    decoded = []
+    for frame_id, (stamps, payloads) in grouped.items():
+        decoder = decoders[frame_id]
+        block = np.frombuffer(bytes(payloads), dtype=np.uint8).reshape(-1, decoder.frame_size)
+        decoded.append(
+            (
+                decoder.name,
+                [sig.name for sig in decoder.signals],
+                np.frombuffer(stamps, dtype=np.float64),
+                decoder.decode_array(block),
+            )
+        )
+    return decoded
+
+
+def _check_frame_ids(messages: list[MessageModel]) -> None:
+    names: dict[int, list[str]] = {}
+    for message in messages:
+        names.setdefault(message.frame_id, []).append(message.name)
+    clashes = [
+        f"0x{frame_id:X} ({', '.join(shared)})"
+        for frame_id, shared in names.items()
+        if len(shared) > 1
+    ]
+    if clashes:
+        raise ExportError(f"messages share a frame ID: {'; '.join(clashes)}")
+
+
+def _decoded_chunks(
+    handle, messages: list[MessageModel], chunk_lines: int, workers: int
+) -> Iterator[tuple[int, DecodedChunk]]:
+    """Yield ``(characters read, decoded chunk)`` in trace order."""
+    chunks = iter(lambda: list(islice(handle, chunk_lines)), [])
+    if workers <= 1:
+        decoders = build_decoders(messages)
+        for lines in chunks:
+            yield sum(map(len, lines)), decode_lines(lines, decoders)
+        return
+
+    # Keep a bounded window of chunks in flight and yield them in order.
+    # Spawned workers stay safe when the caller is a threaded GUI process.
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(messages,),
+    ) as pool:
+        pending: deque[tuple[int, Future]] = deque()
+        for lines in chunks:
+            pending.append((sum(map(len, lines)), pool.submit(_decode_in_worker, lines)))
+            if len(pending) >= 2 * workers:
+                size, future = pending.popleft()
+                yield size, future.result()
+        while pending:
+            size, future = pending.popleft()
+            yield size, future.result()
+
+
+_worker_decoders: dict[int, MessageDecoder] = {}
+
+
+def _init_worker(messages: list[MessageModel]) -> None:
+    global _worker_decoders
+    _worker_decoders = build_decoders(messages)
+
+
+def _decode_in_worker(lines: list[str]) -> DecodedChunk:
+    return decode_lines(lines, _worker_decoders)
+
+
+class _CsvWriter:
+    def __init__(self, out_dir: str) -> None:
+        os.makedirs(out_dir, exist_ok=True)
+        self.out_dir = out_dir
+        self._started: set[str] = set()
+
+    def write(
+        self, name: str, signal_names: list[str], stamps: np.ndarray, values: dict[str, np.ndarray]
+    ) -> None:
+        path = os.path.join(self.out_dir, f"{name}.csv")
+        first = name not in self._started
+        self._started.add(name)
+        table = np.column_stack([stamps] + [values[signal] for signal in signal_names])
+        with open(path, "w" if first else "a", encoding="utf-8", newline="") as handle:
+            if first:
+                handle.write(",".join(["timestamp"] + signal_names) + "\n")
+            np.savetxt(handle, table, fmt="%.17g", delimiter=",")
+
+    def close(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        pass
+
+
+class _NpzWriter:
+    def __init__(self, out_path: str) -> None:
+        self.out_path = out_path
+        self._spool = tempfile.mkdtemp(
+            prefix=".dbcstudio-export-", dir=os.path.dirname(os.path.abspath(out_path))
+        )
+        self._columns: dict[str, int] = {}
+        self._files: dict[str, str] = {}
+
+    def write(
+        self, name: str, signal_names: list[str], stamps: np.ndarray, values: dict[str, np.ndarray]
+    ) -> None:
+        self._append(f"{name}.timestamp", stamps)
+        for signal in signal_names:
+            self._append(f"{name}.{signal}", values[signal])
+
+    def _append(self, key: str, column: np.ndarray) -> None:
+        with open(self._column_path(key), "ab") as handle:
+            handle.write(np.ascontiguousarray(column, dtype="<f8").tobytes())
+        self._columns[key] = self._columns.get(key, 0) + len(column)
+
+    def _column_path(self, key: str) -> str:
+        path = self._files.get(key)
+        if path is None:
+            path = self._files[key] = os.path.join(self._spool, f"{len(self._files)}.f8")
+        return path
+
+    def close(self) -> None:
+        try:
+            with zipfile.ZipFile(self.out_path, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+                for key, count in self._columns.items():
+                    header = {"descr": "<f8", "fortran_order": False, "shape": (count,)}
+                    with zf.open(f"{key}.npy", "w", force_zip64=True) as entry:
+                        np.lib.format.write_array_header_1_0(entry, header)
+                        with open(self._column_path(key), "rb") as column:
+                            shutil.copyfileobj(column, entry, 1 << 20)
+        finally:
+            shutil.rmtree(self._spool, ignore_errors=True)
+
+    def abort(self) -> None:
+        shutil.rmtree(self._spool, ignore_errors=True)
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Optional
+
+from .model import DbcDocument, MessageModel, SignalModel
+
+JOURNAL_SUFFIX = ".journal"
+
+
+class JournalError(Exception):
+    pass
+
+
+def journal_path(doc_path: str) -> str:
+    return doc_path + JOURNAL_SUFFIX
+
+
+class EditJournal:
+    """Append-only log of document edits stored next to the DBC file.
+
+    Records are buffered and written with a single ``fsync`` once
+    ``flush_every`` records are pending or :meth:`flush` is called. Replaying
+    the journal on top of the file at ``doc_path`` restores the edited
+    document (see :func:`replay_journal`).
+
+    The journal is stamped with the state of ``doc_path`` when it is created,
+    so edits made after the file changed on disk are not replayed onto the
+    new contents. :meth:`discard` takes a new stamp after a save.
+    """
+
+    def __init__(self, doc_path: str, flush_every: int = 64) -> None:
+        self.doc_path = doc_path
+        self.path = journal_path(doc_path)
+        self.flush_every = flush_every
+        self.records_since_checkpoint = 0
+        self._pending: list[str] = []
+        self._tail_checked = False
+        self._base = _base_stamp(doc_path)
+        self._doc: Optional[DbcDocument] = None
+
+    def attach(self, doc: DbcDocument) -> None:
+        self.detach()
+        self._doc = doc
+        doc.add_listener(self._record)
+
+    def detach(self) -> None:
+        if self._doc is not None:
+            self._doc.remove_listener(self._record)
+            self._doc = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        if not os.path.exists(self.path):
+            self._pending.insert(0, _encode("base", self._base))
+        elif not self._tail_checked:
+            _drop_partial_record(self.path)
+        self._tail_checked = True
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write("".join(self._pending))
+            handle.flush()
+            os.fsync(handle.fileno())
+        self._pending.clear()
+
+    def compact(self) -> None:
+        """Rewrite the journal as one checkpoint of the attached document."""
+        if self._doc is None:
+            return
+        lines = [
+            _encode("base", self._base),
+            _encode("checkpoint", _document_to_dict(self._doc)),
+        ]
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write("".join(lines))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, self.path)
+        self._pending.clear()
+        self.records_since_checkpoint = 0
+
+    def discard(self) -> None:
+        """Drop the journal, e.g. after the document was saved for real."""
+        self._pending.clear()
+        self.records_since_checkpoint = 0
+        self._base = _base_stamp(self.doc_path)
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _record(self, op: str, payload: dict[str, Any]) -> None:
+        self._pending.append(_encode(op, payload))
+        self.records_since_checkpoint += 1
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+
+def has_journal(doc_path: str) -> bool:
+    return os.path.exists(journal_path(doc_path))
+
+
+def replay_journal(doc: DbcDocument, path: str) -> int:
+    """Apply the records in journal ``path`` to ``doc`` and return how many were applied.
+
+    ``doc`` must be the document loaded from the file the journal was started
+    on; a journal whose base file has changed since raises ``JournalError``.
+    A truncated final record (crash while writing) is ignored.
+    """
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    records = []
+    for line_no, line in enumerate(lines):
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            if line_no == len(lines) - 1:
+                break
+            raise JournalError(f"{path}: corrupt record on line {line_no + 1}") from None
+
+    if not records or records[0].get("op") != "base":
+        raise JournalError(f"{path}: missing journal header")
+    base = {key: value for key, value in records[0].items() if key != "op"}
+    if doc.path is not None and base != _base_stamp(doc.path):
+        raise JournalError(f"{path}: {doc.path} changed since the journal was written")
+
+    for record in records[1:]:
+        op = record.pop("op", None)
+        try:
+            apply_edit(doc, op, record)
+        except (IndexError, KeyError, TypeError, ValueError) as exc:
+            raise JournalError(f"{path}: cannot apply {op!r}: {exc}") from exc
+    return len(records) - 1
+
+
+def apply_edit(doc: DbcDocument, op: str, payload: dict[str, Any]) -> None:
+    if op == "checkpoint":
+        restored = _document_from_dict(payload)
+        doc.version = restored.version
+        doc.messages = restored.messages
+        doc.reindex()
+    elif op == "add_message":
+        doc.add_message(_message_from_dict(payload["message"]))
+    elif op == "add_messages":
+        doc.add_messages(_message_from_dict(item) for item in payload["messages"])
+    elif op == "remove_message":
+        doc.remove_message(payload["index"])
+    elif op == "update_message":
+        doc.update_message(doc.messages[payload["index"]], **payload["fields"])
+    elif op == "set_signals":
+        doc.set_signals(
+            doc.messages[payload["index"]],
+            [_signal_from_dict(item) for item in payload["signals"]],
+        )
+    elif op == "add_signal":
+        doc.add_signal(doc.messages[payload["index"]], _signal_from_dict(payload["signal"]))
+    elif op == "remove_signal":
+        doc.remove_signal(doc.messages[payload["index"]], payload["signal_index"])
+    elif op == "renumber_frame_ids":
+        doc.renumber_frame_ids(payload["first"], payload["last"], payload["new_first"])
+    elif op == "rename_prefix":
+        doc.rename_prefix(payload["old_prefix"], payload["new_prefix"])
+    elif op == "move_signals":
+        doc.move_signals(
+            doc.messages[payload["source"]], doc.messages[payload["target"]], payload["names"]
+        )
+    else:
+        raise JournalError(f"unknown journal operation {op!r}")
+
+
+def _encode(op: str, payload: dict[str, Any]) -> str:
+    record = {"op": op}
+    record.update(payload)
+    return json.dumps(record, default=_encode_model, separators=(",", ":")) + "\n"
+
+
+def _encode_model(value: Any) -> Any:
+    if isinstance(value, (MessageModel, SignalModel)):
+        return asdict(value)
+    raise TypeError(f"cannot journal {type(value).__name__}")
+
+
+def _drop_partial_record(path: str) -> None:
+    with open(path, "rb+") as handle:
+        data = handle.read()
+        if data and not data.endswith(b"\n"):
+            handle.truncate(data.rfind(b"\n") + 1)
+
+
+def _base_stamp(doc_path: str) -> dict[str, Any]:
+    try:
+        stat = os.stat(doc_path)
+    except OSError:
+        return {"path": doc_path, "mtime_ns": None, "size": None}
+    return {"path": doc_path, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _document_to_dict(doc: DbcDocument) -> dict[str, Any]:
+    return {"version": doc.version, "messages": [asdict(message) for message in doc.messages]}
+
+
+def _document_from_dict(data: dict[str, Any]) -> DbcDocument:
+    return DbcDocument(
+        version=data.get("version"),
+        messages=[_message_from_dict(item) for item in data.get("messages", [])],
+    )
+
+
+def _message_from_dict(data: dict[str, Any]) -> MessageModel:
+    fields = dict(data)
+    fields["signals"] = [_signal_from_dict(item) for item in fields.get("signals", [])]
+    return MessageModel(**fields)
+
+
+def _signal_from_dict(data: dict[str, Any]) -> SignalModel:
+    return SignalModel(**data)
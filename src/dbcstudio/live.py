@@ -0,0 +1,263 @@
+"""Live CAN monitoring against a local virtual bus.
+
+Frames arrive on an asyncio loop running in a background thread and are
+handed to :class:`LiveMonitor` in batches. Only the newest frame of the
+selected message in each batch is decoded; the GUI polls :meth:`LiveMonitor.latest`
+on a timer, so the Qt event loop sees a fixed refresh rate whatever the bus load.
+
+The virtual bus is a local UDP socket carrying one frame per datagram (see
+:func:`encode_frame`), so the replay generator can run in another process:
+``python -m dbcstudio.live replay <file.dbc>`` feeds it with synthetic traffic
+for load testing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import struct
+import threading
+import time
+from typing import Callable, Iterator, NamedTuple, Optional
+
+from .decode import MessageDecoder
+from .model import DbcDocument, MessageModel
+from .trace import Frame
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 29536
+BATCH_INTERVAL = 0.01
+BATCH_SIZE = 1024
+
+_FRAME_HEADER = struct.Struct("<dIB")
+
+
+FrameSink = Callable[["list[Frame]"], None]
+
+
+def encode_frame(frame: Frame) -> bytes:
+    return _FRAME_HEADER.pack(frame.timestamp, frame.frame_id, len(frame.data)) + frame.data
+
+
+def decode_frame(packet: bytes) -> Frame:
+    offset = _FRAME_HEADER.size
+    if len(packet) < offset:
+        raise ValueError(f"frame packet of {len(packet)} bytes is shorter than its header")
+    timestamp, frame_id, size = _FRAME_HEADER.unpack_from(packet)
+    if len(packet) < offset + size:
+        raise ValueError(f"frame packet declares {size} data bytes but carries fewer")
+    return Frame(timestamp, frame_id, packet[offset:offset + size])
+
+
+class UdpFrameSource:
+    """Receive frames sent as UDP datagrams to ``host:port``.
+
+    Datagrams that are not valid frames are counted in ``dropped`` and ignored,
+    so stray traffic on the port cannot stop the monitor.
+    """
+
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        self.host = host
+        self.port = port
+        self.dropped = 0
+
+    async def run(self, sink: FrameSink) -> None:
+        loop = asyncio.get_running_loop()
+        pending: list[bytes] = []
+        ready = asyncio.Event()
+
+        class _Protocol(asyncio.DatagramProtocol):
+            def datagram_received(self, data: bytes, addr) -> None:
+                pending.append(data)
+                if len(pending) >= BATCH_SIZE:
+                    ready.set()
+
+        transport, _ = await loop.create_datagram_endpoint(
+            _Protocol, local_addr=(self.host, self.port)
+        )
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(ready.wait(), BATCH_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                ready.clear()
+                if pending:
+                    packets = pending[:]
+                    del pending[:]
+                    sink(self._decode_all(packets))
+        finally:
+            transport.close()
+
+    def _decode_all(self, packets: list[bytes]) -> list[Frame]:
+        frames = []
+        for packet in packets:
+            try:
+                frames.append(decode_frame(packet))
+            except ValueError:
+                self.dropped += 1
+        return frames
+
+
+class LiveSnapshot(NamedTuple):
+    values: dict[str, float]
+    frames: int
+    matched: int
+    updated: float
+
+
+class LiveMonitor:
+    """Decode the selected message from a frame source on a background loop."""
+
+    def __init__(self, source: Optional[object] = None) -> None:
+        self.source = source or UdpFrameSource()
+        self._lock = threading.Lock()
+        self._decoder: Optional[MessageDecoder] = None
+        self._snapshot = LiveSnapshot({}, 0, 0, 0.0)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Future] = None
+        self._thread: Optional[threading.Thread] = None
+        self.error: Optional[BaseException] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def select(self, message: Optional[MessageModel]) -> None:
+        decoder = MessageDecoder(message) if message is not None else None
+        with self._lock:
+            self._decoder = decoder
+            self._snapshot = self._snapshot._replace(values={}, matched=0)
+
+    def latest(self) -> LiveSnapshot:
+        with self._lock:
+            return self._snapshot
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.error = None
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run_loop, args=(started,), name="dbcstudio-live", daemon=True
+        )
+        self._thread.start()
+        started.wait()
+
+    def stop(self) -> None:
+        loop, thread, task = self._loop, self._thread, self._task
+        self._loop = self._thread = self._task = None
+        if loop is None or thread is None:
+            return
+        # A failed source has already ended the loop; there is nothing to cancel.
+        if task is not None and thread.is_alive() and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:  # closed between the check and the call
+                pass
+        thread.join(timeout=2.0)
+
+    def ingest(self, frames: list[Frame]) -> None:
+        decoder = self._decoder
+        newest: Optional[Frame] = None
+        matched = 0
+        if decoder is not None:
+            for frame in frames:
+                if frame.frame_id == decoder.frame_id:
+                    newest = frame
+                    matched += 1
+        values = decoder.decode(newest.data) if newest is not None else None
+        with self._lock:
+            if decoder is not self._decoder:
+                values, matched = None, 0
+            snap = self._snapshot
+            self._snapshot = LiveSnapshot(
+                values if values is not None else snap.values,
+                snap.frames + len(frames),
+                snap.matched + matched,
+                time.monotonic() if values is not None else snap.updated,
+            )
+
+    def _run_loop(self, started: threading.Event) -> None:
+        loop = self._loop
+        asyncio.set_event_loop(loop)
+        self._task = loop.create_task(self.source.run(self.ingest))
+        started.set()
+        try:
+            loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as exc:  # surfaced to the GUI through ``error``
+            self.error = exc
+        finally:
+            loop.close()
+
+
+def replay_frames(
+    doc: DbcDocument, seed: Optional[int] = None, start: float = 0.0, period: float = 0.0
+) -> Iterator[Frame]:
+    """Endless round-robin of random payloads for every message in ``doc``."""
+    rng = random.Random(seed)
+    messages = list(doc.messages) or [MessageModel(frame_id=0x100, name="Dummy", length=8)]
+    timestamp = start
+    while True:
+        for message in messages:
+            size = max(0, min(message.length, 64))
+            payload = rng.getrandbits(8 * size).to_bytes(size, "little")
+            yield Frame(timestamp, message.frame_id, payload)
+            timestamp += period
+
+
+async def send_replay(
+    frames: Iterator[Frame],
+    rate: float,
+    duration: float,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+) -> int:
+    """Send ``frames`` over UDP at ``rate`` frames/s for ``duration`` seconds."""
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        asyncio.DatagramProtocol, remote_addr=(host, port)
+    )
+    sent = 0
+    began = loop.time()
+    try:
+        while True:
+            elapsed = loop.time() - began
+            if elapsed >= duration:
+                break
+            due = int(elapsed * rate) - sent
+            for _ in range(max(0, due)):
+                frame = next(frames)
+                transport.sendto(encode_frame(frame._replace(timestamp=time.time())))
+            sent += max(0, due)
+            await asyncio.sleep(BATCH_INTERVAL)
+    finally:
+        transport.close()
+    return sent
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m dbcstudio.live")
+    sub = parser.add_subparsers(dest="command", required=True)
+    replay = sub.add_parser("replay", help="send synthetic frames for the messages of a DBC file")
+    replay.add_argument("dbc")
+    replay.add_argument("--rate", type=float, default=10000.0, help="frames per second")
+    replay.add_argument("--seconds", type=float, default=10.0)
+    replay.add_argument("--host", default=DEFAULT_HOST)
+    replay.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+
+    from .dbc_io import load_dbc
+
+    frames = replay_frames(load_dbc(args.dbc))
+    sent = asyncio.run(send_replay(frames, args.rate, args.seconds, args.host, args.port))
+    print(f"sent {sent} frames ({sent / args.seconds:.0f}/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QComboBox,
     QFileDialog,
     QFormLayout,
     QFrame,
     QHBoxLayout,
+    QInputDialog,
     QLabel,
     QLineEdit,
     QListWidget,
@@ -22,14 +26,26 @@ from PySide6.QtWidgets import (
     QStatusBar,
     QTableWidget,
     QTableWidgetItem,
+    QTabWidget,
     QVBoxLayout,
     QWidget,
 )
 
+from .busload import BusLoadAnalyzer
 from .dbc_io import load_dbc, save_dbc
-from .model import DbcDocument, MessageModel, SignalModel
+from .decode import decode_key
+from .downsample import MinMaxPyramid, read_signal_pyramid
+from .export import export_signals
+from .journal import EditJournal, JournalError, has_journal, journal_path, replay_journal
+from .live import LiveMonitor
+from .model import DbcDocument, DocumentSnapshot, MessageModel, SignalModel, mux_id_ranges
 from .style import APP_STYLESHEET
-from .widgets import SignalBitLayout
+from .widgets import BusLoadReport, LiveSignalView, SignalBitLayout, SignalPlot
+
+JOURNAL_IDLE_MS = 2000
+JOURNAL_COMPACT_AFTER = 500
+LIVE_REFRESH_HZ = 20
+PLOT_CACHE_BYTES = 512 * 1024 * 1024
 
 
 class MainWindow(QMainWindow):
@@ -41,6 +57,28 @@ class MainWindow(QMainWindow):
 
         self.doc = DbcDocument(messages=[])
         self.current_message_index: Optional[int] = None
+        self.journal: Optional[EditJournal] = None
+        self.bus_load = BusLoadAnalyzer()
+        self.bus_load.attach(self.doc)
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(JOURNAL_IDLE_MS)
+        self.live_monitor = LiveMonitor()
+        self.live_timer = QTimer(self)
+        self.live_timer.setInterval(1000 // LIVE_REFRESH_HZ)
+        self._live_updated = 0.0
+        self.trace_path: Optional[str] = None
+        # (decode key, signal name) -> pyramid, least recently shown first.
+        self._plot_cache: OrderedDict[tuple, MinMaxPyramid] = OrderedDict()
+        self._plotted: Optional[tuple] = None
+        self._plot_thread: Optional[threading.Thread] = None
+        self._plot_state: dict = {}
+        self.plot_timer = QTimer(self)
+        self.plot_timer.setInterval(100)
+        self._export_thread: Optional[threading.Thread] = None
+        self._export_state: dict = {}
+        self.export_timer = QTimer(self)
+        self.export_timer.setInterval(200)
 
         self._build_ui()
         self._bind_events()
@@ -58,13 +96,24 @@ class MainWindow(QMainWindow):
         self.save_as_btn = QPushButton("Save As")
         self.add_msg_btn = QPushButton("Add Message")
         self.remove_msg_btn = QPushButton("Remove Message")
+        self.renumber_btn = QPushButton("Renumber IDs")
+        self.rename_prefix_btn = QPushButton("Rename Prefix")
+        self.open_trace_btn = QPushButton("Open Trace")
+        self.export_btn = QPushButton("Export Signals")
+        self.live_btn = QPushButton("Start Live")
+        self.live_btn.setCheckable(True)
         top_bar.addWidget(self.open_btn)
         top_bar.addWidget(self.save_btn)
         top_bar.addWidget(self.save_as_btn)
         top_bar.addSpacing(12)
         top_bar.addWidget(self.add_msg_btn)
         top_bar.addWidget(self.remove_msg_btn)
+        top_bar.addWidget(self.renumber_btn)
+        top_bar.addWidget(self.rename_prefix_btn)
         top_bar.addStretch(1)
+        top_bar.addWidget(self.open_trace_btn)
+        top_bar.addWidget(self.export_btn)
+        top_bar.addWidget(self.live_btn)
         root.addLayout(top_bar)
 
         splitter = QSplitter(Qt.Horizontal)
@@ -96,10 +145,15 @@ class MainWindow(QMainWindow):
         self.msg_length.setRange(0, 64)
         self.msg_sender = QLineEdit()
         self.msg_sender.setPlaceholderText("e.g. BodyController")
+        self.msg_cycle_time = QSpinBox()
+        self.msg_cycle_time.setRange(0, 65535)
+        self.msg_cycle_time.setSuffix(" ms")
+        self.msg_cycle_time.setSpecialValueText("Event driven")
         form.addRow("Name", self.msg_name)
         form.addRow("Frame ID", frame_id_row)
         form.addRow("Length", self.msg_length)
         form.addRow("Sender", self.msg_sender)
+        form.addRow("Cycle Time", self.msg_cycle_time)
         center_layout.addLayout(form)
         self._set_frame_id_display_mode("Decimal")
 
@@ -114,17 +168,32 @@ class MainWindow(QMainWindow):
         signal_row.addWidget(self.remove_signal_btn)
         center_layout.addLayout(signal_row)
 
-        self.signal_table = QTableWidget(0, 8)
+        self.signal_table = QTableWidget(0, 9)
         self.signal_table.setHorizontalHeaderLabels(
-            ["Name", "Start", "Length", "Endian", "Signed", "Scale", "Offset", "Unit"]
+            ["Name", "Start", "Length", "Endian", "Signed", "Scale", "Offset", "Unit", "Mux"]
+        )
+        self.signal_table.horizontalHeaderItem(8).setToolTip(
+            "M = multiplexer, m3 = present when the multiplexer is 3, "
+            "m1-3,7 = extended ranges, m2M = nested multiplexer"
         )
         self.signal_table.horizontalHeader().setStretchLastSection(True)
         center_layout.addWidget(self.signal_table)
 
         right = self._panel_widget("Bit Layout")
         right_layout = right.layout()
+        self.mux_value = QComboBox()
+        self.mux_value.setToolTip("Show the layout for one multiplexer value")
         self.bit_layout = SignalBitLayout()
+        right_layout.addWidget(self.mux_value)
         right_layout.addWidget(self.bit_layout)
+        self.live_view = LiveSignalView()
+        self.signal_plot = SignalPlot()
+        self.data_tabs = QTabWidget()
+        self.data_tabs.addTab(self.live_view, "Live Values")
+        self.data_tabs.addTab(self.signal_plot, "Plot")
+        self.bus_load_report = BusLoadReport()
+        self.data_tabs.addTab(self.bus_load_report, "Bus Load")
+        right_layout.addWidget(self.data_tabs)
 
         splitter.addWidget(left)
         splitter.addWidget(center)
@@ -153,6 +222,8 @@ class MainWindow(QMainWindow):
         self.save_as_btn.clicked.connect(self.save_file_as)
         self.add_msg_btn.clicked.connect(self.add_message)
         self.remove_msg_btn.clicked.connect(self.remove_message)
+        self.renumber_btn.clicked.connect(self.renumber_messages)
+        self.rename_prefix_btn.clicked.connect(self.rename_message_prefix)
         self.message_list.currentRowChanged.connect(self._message_selected)
         self.message_search.textChanged.connect(self._refresh_message_list)
 
@@ -161,10 +232,31 @@ class MainWindow(QMainWindow):
         self.msg_frame_id_mode.currentTextChanged.connect(self._set_frame_id_display_mode)
         self.msg_length.editingFinished.connect(self._apply_message_fields)
         self.msg_sender.editingFinished.connect(self._apply_message_fields)
+        self.msg_cycle_time.editingFinished.connect(self._apply_message_fields)
+        self.msg_length.valueChanged.connect(self._preview_bus_load)
+        self.msg_cycle_time.valueChanged.connect(self._preview_bus_load)
 
         self.add_signal_btn.clicked.connect(self.add_signal)
         self.remove_signal_btn.clicked.connect(self.remove_signal)
         self.signal_table.itemChanged.connect(self._on_signal_table_changed)
+        self.idle_timer.timeout.connect(self._on_idle)
+        self.live_btn.toggled.connect(self.toggle_live)
+        self.open_trace_btn.clicked.connect(self.open_trace)
+        self.export_btn.clicked.connect(self.export_decoded_signals)
+        self.export_timer.timeout.connect(self._poll_export)
+        self.plot_timer.timeout.connect(self._poll_plot)
+        self.signal_table.currentCellChanged.connect(self._plot_selected_signal)
+        self.mux_value.currentIndexChanged.connect(self._on_mux_value_changed)
+        self.live_timer.timeout.connect(self._refresh_live_values)
+        self.data_tabs.currentChanged.connect(self._refresh_bus_load)
+        self.bus_load_report.bitrate.currentIndexChanged.connect(self._on_bitrate_changed)
+
+    def closeEvent(self, event) -> None:  # noqa: N802
+        self._cancel_plot_load()
+        self.live_monitor.stop()
+        if self.journal is not None:
+            self.journal.flush()
+        super().closeEvent(event)
 
     def open_file(self) -> None:
         path, _ = QFileDialog.getOpenFileName(
@@ -177,11 +269,18 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            self.doc = load_dbc(path)
+            doc = load_dbc(path)
         except Exception as exc:  # pragma: no cover - Qt pathway
             QMessageBox.critical(self, "Open failed", str(exc))
             return
 
+        self._stop_journal()
+        self.doc = doc
+
+        if has_journal(path):
+            self._recover_from_journal()
+        self._start_journal()
+        self.bus_load.attach(self.doc)
         self.current_message_index = 0 if self.doc.messages else None
         self._refresh_message_list()
         self._load_selected_message()
@@ -192,6 +291,14 @@ class MainWindow(QMainWindow):
             self._apply_message_fields()
             self._pull_signals_from_table()
             save_dbc(self.doc, self.doc.path)
+            if self.journal is not None and self.journal.doc_path != self.doc.path:
+                # Saved under a new name: the old file's journal would replay these
+                # edits onto a file that never received them.
+                self.journal.discard()
+                self._stop_journal()
+            if self.journal is None:
+                self._start_journal()
+            self.journal.discard()
             self.statusBar().showMessage(f"Saved {self.doc.path}")
             return
         self.save_file_as()
@@ -208,16 +315,292 @@ class MainWindow(QMainWindow):
         self.doc.path = path
         self.save_file()
 
+    def _recover_from_journal(self) -> None:
+        path = journal_path(self.doc.path)
+        answer = QMessageBox.question(
+            self,
+            "Recover changes",
+            "Unsaved changes from a previous session were found. Recover them?",
+        )
+        if answer != QMessageBox.Yes:
+            os.remove(path)
+            return
+        try:
+            count = replay_journal(self.doc, path)
+        except JournalError as exc:
+            os.replace(path, path + ".rejected")
+            QMessageBox.warning(self, "Recovery failed", f"{exc}\nJournal kept as {path}.rejected")
+            self.doc = load_dbc(self.doc.path)
+            return
+        self.statusBar().showMessage(f"Recovered {count} edit(s)")
+
+    def _start_journal(self) -> None:
+        self._stop_journal()
+        if not self.doc.path:
+            return
+        self.journal = EditJournal(self.doc.path)
+        self.journal.attach(self.doc)
+        self.doc.add_listener(self._on_document_edited)
+
+    def _stop_journal(self) -> None:
+        """Flush and detach the journal of the current document, keeping its file."""
+        if self.journal is None:
+            return
+        self.journal.flush()
+        self.journal.detach()
+        self.journal = None
+        self.doc.remove_listener(self._on_document_edited)
+        self.idle_timer.stop()
+
+    def _on_document_edited(self, _op: str, _payload: dict) -> None:
+        self.idle_timer.start()
+
+    def _on_idle(self) -> None:
+        if self.journal is None:
+            return
+        if self.journal.records_since_checkpoint >= JOURNAL_COMPACT_AFTER:
+            self.journal.compact()
+        else:
+            self.journal.flush()
+
+    def open_trace(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Open CAN Trace",
+            str(Path.cwd()),
+            "candump Logs (*.log);;All Files (*)",
+        )
+        if not path:
+            return
+        self.trace_path = path
+        self._plot_cache.clear()
+        self._plotted = None
+        self.data_tabs.setCurrentWidget(self.signal_plot)
+        self._plot_selected_signal(self.signal_table.currentRow())
+        self.statusBar().showMessage(f"Trace {path}")
+
+    def _plot_selected_signal(self, row: int, *_args) -> None:
+        message = self._current_message()
+        if self.trace_path is None or message is None or not message.signals:
+            self._cancel_plot_load()
+            self._plotted = None
+            self.signal_plot.clear()
+            return
+        signal = message.signals[row if 0 <= row < len(message.signals) else 0]
+        title = f"{message.name}.{signal.name}"
+        key = (decode_key(message), signal.name)
+        if self._plotted == key:
+            self.signal_plot.set_title(title)
+            return
+        self._plotted = key
+        self._cancel_plot_load()
+        pyramid = self._plot_cache.get(key)
+        if pyramid is not None:
+            self._plot_cache.move_to_end(key)
+            self.signal_plot.set_pyramid(title, pyramid)
+            return
+
+        # Decoding a long trace takes seconds; do it off the GUI thread. The
+        # snapshot keeps the message unchanged while the worker reads it.
+        self.signal_plot.clear()
+        snapshot = self.doc.snapshot()
+        cancel = threading.Event()
+        self._plot_state = {
+            "key": key,
+            "title": title,
+            "snapshot": snapshot,
+            "cancel": cancel,
+            "progress": (0, 1),
+        }
+        self._plot_thread = threading.Thread(
+            target=self._run_plot_load,
+            args=(
+                self._plot_state,
+                self.trace_path,
+                snapshot.messages[self.current_message_index],
+                signal.name,
+            ),
+            name="dbcstudio-plot",
+            daemon=True,
+        )
+        self._plot_thread.start()
+        self.plot_timer.start()
+
+    def _run_plot_load(
+        self, state: dict, trace_path: str, message: MessageModel, signal_name: str
+    ) -> None:
+        def progress(done: int, total: int) -> None:
+            state["progress"] = (done, total)
+
+        # One signal decodes serially: spawning a process pool per selection
+        # costs more than it saves and leaves pools draining after a cancel.
+        try:
+            state["pyramid"] = read_signal_pyramid(
+                trace_path, message, signal_name, cancel=state["cancel"], progress=progress
+            )
+        except Exception as exc:  # reported by _poll_plot
+            state["error"] = exc
+
+    def _cancel_plot_load(self) -> None:
+        if self._plot_state:
+            self._plot_state["cancel"].set()
+        self._plot_state = {}
+        self._plot_thread = None
+        self.plot_timer.stop()
+
+    def _poll_plot(self) -> None:
+        state = self._plot_state
+        if not state:
+            self.plot_timer.stop()
+            return
+        if self._plot_thread is not None and self._plot_thread.is_alive():
+            done, total = state["progress"]
+            self.statusBar().showMessage(f"Reading trace... {100 * done // max(1, total)}%")
+            return
+        self.plot_timer.stop()
+        self._plot_thread = None
+        self._plot_state = {}
+        if "error" in state:
+            self._plotted = None
+            if isinstance(state["error"], OSError):
+                self.trace_path = None
+            QMessageBox.warning(self, "Trace failed", str(state["error"]))
+            return
+        pyramid = state.get("pyramid")
+        if pyramid is None or state["key"] != self._plotted:
+            return
+        self._cache_pyramid(state["key"], pyramid)
+        self.signal_plot.set_pyramid(state["title"], pyramid)
+        self.statusBar().showMessage(f"Plotted {len(pyramid)} samples of {state['title']}")
+
+    def _cache_pyramid(self, key: tuple, pyramid: MinMaxPyramid) -> None:
+        """Keep recently plotted signals while their total size fits ``PLOT_CACHE_BYTES``.
+
+        A pyramid larger than the whole budget is not cached, so it does not
+        evict everything else.
+        """
+        if pyramid.nbytes > PLOT_CACHE_BYTES:
+            return
+        self._plot_cache[key] = pyramid
+        used = sum(cached.nbytes for cached in self._plot_cache.values())
+        while used > PLOT_CACHE_BYTES:
+            _, evicted = self._plot_cache.popitem(last=False)
+            used -= evicted.nbytes
+
+    def export_decoded_signals(self) -> None:
+        if self._export_thread is not None or not self.doc.messages:
+            return
+        trace_path = self.trace_path
+        if trace_path is None:
+            trace_path, _ = QFileDialog.getOpenFileName(
+                self,
+                "Open CAN Trace",
+                str(Path.cwd()),
+                "candump Logs (*.log);;All Files (*)",
+            )
+            if not trace_path:
+                return
+        out_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Decoded Signals",
+            str(Path.cwd() / "signals.npz"),
+            "NumPy Archive (*.npz);;CSV Folder (*)",
+        )
+        if not out_path:
+            return
+
+        fmt = "npz" if out_path.endswith(".npz") else "csv"
+        # The export runs in a thread; edits made meanwhile do not reach the snapshot.
+        doc = self.doc.snapshot()
+        self._export_state = {"progress": (0, 1)}
+        self._export_thread = threading.Thread(
+            target=self._run_export,
+            args=(doc, trace_path, out_path, fmt, _decode_workers()),
+            name="dbcstudio-export",
+            daemon=True,
+        )
+        self._export_thread.start()
+        self.export_btn.setEnabled(False)
+        self.export_timer.start()
+
+    def _run_export(
+        self, doc: DocumentSnapshot, trace_path: str, out_path: str, fmt: str, workers: int
+    ) -> None:
+        state = self._export_state
+
+        def progress(done: int, total: int) -> None:
+            state["progress"] = (done, total)
+
+        try:
+            rows = export_signals(
+                doc, trace_path, out_path, fmt, workers=workers, progress=progress
+            )
+            state["result"] = (out_path, sum(rows.values()))
+        except Exception as exc:  # reported by _poll_export
+            state["error"] = exc
+
+    def _poll_export(self) -> None:
+        state = self._export_state
+        if self._export_thread is not None and self._export_thread.is_alive():
+            done, total = state["progress"]
+            self.statusBar().showMessage(f"Exporting... {100 * done // max(1, total)}%")
+            return
+        self.export_timer.stop()
+        self._export_thread = None
+        self.export_btn.setEnabled(True)
+        if "error" in state:
+            QMessageBox.warning(self, "Export failed", str(state["error"]))
+        elif "result" in state:
+            out_path, count = state["result"]
+            self.statusBar().showMessage(f"Exported {count} frames to {out_path}")
+
+    def toggle_live(self, enabled: bool) -> None:
+        if enabled:
+            self._sync_data_views()
+            self.live_monitor.start()
+            self.live_timer.start()
+            self.live_btn.setText("Stop Live")
+            source = self.live_monitor.source
+            self.statusBar().showMessage(
+                f"Listening for frames on udp://{source.host}:{source.port}"
+            )
+        else:
+            self.live_timer.stop()
+            self.live_monitor.stop()
+            self.live_btn.setText("Start Live")
+
+    def _sync_data_views(self) -> None:
+        message = self._current_message()
+        self.live_view.set_message(message)
+        self.live_monitor.select(message)
+        self._live_updated = 0.0
+        self._plot_selected_signal(self.signal_table.currentRow())
+
+    def _refresh_live_values(self) -> None:
+        if self.live_monitor.error is not None:
+            error = self.live_monitor.error
+            self.live_btn.setChecked(False)
+            QMessageBox.warning(self, "Live monitor stopped", str(error))
+            return
+        snapshot = self.live_monitor.latest()
+        if snapshot.updated != self._live_updated:
+            self._live_updated = snapshot.updated
+            self.live_view.set_values(snapshot.values)
+        status = f"Live: {snapshot.frames} frames, {snapshot.matched} for selected message"
+        dropped = getattr(self.live_monitor.source, "dropped", 0)
+        if dropped:
+            status += f", {dropped} malformed dropped"
+        self.statusBar().showMessage(status)
+
     def add_message(self) -> None:
-        name = self._unique_message_name("NewMessage")
         message = MessageModel(
-            frame_id=self._next_frame_id(),
-            name=name,
+            frame_id=self.doc.next_frame_id(),
+            name=self.doc.unique_message_name("NewMessage"),
             length=8,
             senders=["Vector__XXX"],
             signals=[],
         )
-        self.doc.messages.append(message)
+        self.doc.add_message(message)
         self.current_message_index = len(self.doc.messages) - 1
         self._refresh_message_list()
         self._load_selected_message()
@@ -225,7 +608,7 @@ class MainWindow(QMainWindow):
     def remove_message(self) -> None:
         if self.current_message_index is None:
             return
-        del self.doc.messages[self.current_message_index]
+        self.doc.remove_message(self.current_message_index)
         if not self.doc.messages:
             self.current_message_index = None
         else:
@@ -233,18 +616,51 @@ class MainWindow(QMainWindow):
         self._refresh_message_list()
         self._load_selected_message()
 
+    def renumber_messages(self) -> None:
+        text, ok = QInputDialog.getText(
+            self, "Renumber IDs", "Frame ID range (e.g. 0x100-0x1FF):"
+        )
+        if not ok or not text.strip():
+            return
+        start_text, ok = QInputDialog.getText(self, "Renumber IDs", "New first frame ID:")
+        if not ok or not start_text.strip():
+            return
+        try:
+            first_text, _, last_text = text.partition("-")
+            first = int(first_text.strip(), 0)
+            last = int(last_text.strip(), 0) if last_text.strip() else first
+            count = self.doc.renumber_frame_ids(first, last, int(start_text.strip(), 0))
+        except ValueError as exc:
+            QMessageBox.warning(self, "Renumber failed", str(exc))
+            return
+        self._refresh_message_list()
+        self._load_selected_message()
+        self.statusBar().showMessage(f"Renumbered {count} message(s)")
+
+    def rename_message_prefix(self) -> None:
+        old_prefix, ok = QInputDialog.getText(self, "Rename Prefix", "Current name prefix:")
+        if not ok or not old_prefix:
+            return
+        new_prefix, ok = QInputDialog.getText(self, "Rename Prefix", "Replace with:")
+        if not ok:
+            return
+        try:
+            count = self.doc.rename_prefix(old_prefix, new_prefix)
+        except ValueError as exc:
+            QMessageBox.warning(self, "Rename failed", str(exc))
+            return
+        self._refresh_message_list()
+        self._load_selected_message()
+        self.statusBar().showMessage(f"Renamed {count} message(s)")
+
     def add_signal(self) -> None:
         message = self._current_message()
         if not message:
             return
-        existing = {sig.name for sig in message.signals}
-        base = "Signal"
-        idx = 1
-        while f"{base}{idx}" in existing:
-            idx += 1
-        message.signals.append(
+        self.doc.add_signal(
+            message,
             SignalModel(
-                name=f"{base}{idx}",
+                name=message.unique_signal_name("Signal"),
                 start=0,
                 length=8,
                 byte_order="little_endian",
@@ -255,10 +671,12 @@ class MainWindow(QMainWindow):
                 maximum=255.0,
                 unit="",
                 receivers=["Vector__XXX"],
-            )
+            ),
         )
+        message = self._current_message()
         self._load_signals(message)
-        self.bit_layout.set_message(message)
+        self._show_bit_layout(message)
+        self._sync_data_views()
 
     def remove_signal(self) -> None:
         message = self._current_message()
@@ -267,9 +685,11 @@ class MainWindow(QMainWindow):
         row = self.signal_table.currentRow()
         if row < 0 or row >= len(message.signals):
             return
-        del message.signals[row]
+        self.doc.remove_signal(message, row)
+        message = self._current_message()
         self._load_signals(message)
-        self.bit_layout.set_message(message)
+        self._show_bit_layout(message)
+        self._sync_data_views()
 
     def _message_selected(self, row: int) -> None:
         names = self._filtered_message_indices()
@@ -280,7 +700,14 @@ class MainWindow(QMainWindow):
 
     def _load_selected_message(self) -> None:
         message = self._current_message()
-        for widget in [self.msg_name, self.msg_frame_id, self.msg_length, self.msg_sender]:
+        editors = [
+            self.msg_name,
+            self.msg_frame_id,
+            self.msg_length,
+            self.msg_sender,
+            self.msg_cycle_time,
+        ]
+        for widget in editors:
             widget.blockSignals(True)
 
         if not message:
@@ -288,29 +715,72 @@ class MainWindow(QMainWindow):
             self.msg_frame_id.setValue(0)
             self.msg_length.setValue(0)
             self.msg_sender.setText("")
+            self.msg_cycle_time.setValue(0)
             self.signal_table.setRowCount(0)
-            self.bit_layout.set_message(None)
+            self._show_bit_layout(None)
         else:
             self.msg_name.setText(message.name)
             self.msg_frame_id.setValue(message.frame_id)
             self.msg_length.setValue(message.length)
             self.msg_sender.setText(message.senders[0] if message.senders else "")
+            self.msg_cycle_time.setValue(message.cycle_time or 0)
             self._load_signals(message)
-            self.bit_layout.set_message(message)
+            self._show_bit_layout(message)
 
-        for widget in [self.msg_name, self.msg_frame_id, self.msg_length, self.msg_sender]:
+        for widget in editors:
             widget.blockSignals(False)
+        self._sync_data_views()
 
     def _apply_message_fields(self) -> None:
         message = self._current_message()
         if not message:
             return
-        message.name = self.msg_name.text().strip() or message.name
-        message.frame_id = int(self.msg_frame_id.value())
-        message.length = int(self.msg_length.value())
         sender = self.msg_sender.text().strip()
-        message.senders = [sender] if sender else []
+        self.doc.update_message(
+            message,
+            name=self.msg_name.text().strip() or message.name,
+            frame_id=int(self.msg_frame_id.value()),
+            length=int(self.msg_length.value()),
+            senders=[sender] if sender else [],
+            cycle_time=int(self.msg_cycle_time.value()),
+        )
         self._refresh_message_list()
+        self._sync_data_views()
+
+    def _refresh_bus_load(self, *_args) -> None:
+        if self.data_tabs.currentWidget() is self.bus_load_report:
+            self.bus_load_report.show_report(self.bus_load)
+
+    def _on_bitrate_changed(self, _index: int) -> None:
+        self.bus_load.set_bitrate(self.bus_load_report.bitrate.currentData())
+        self._refresh_bus_load()
+
+    def _preview_bus_load(self, _value: int) -> None:
+        if self.current_message_index is None or not self._current_message():
+            return
+        load = self.bus_load.what_if(
+            self.current_message_index,
+            length=int(self.msg_length.value()),
+            cycle_time=int(self.msg_cycle_time.value()),
+        )
+        self.statusBar().showMessage(f"Bus load with this change: {load:.1%}")
+
+    def _show_bit_layout(self, message: Optional[MessageModel]) -> None:
+        values = message.mux_values() if message else []
+        current = self.mux_value.currentData()
+        self.mux_value.blockSignals(True)
+        self.mux_value.clear()
+        self.mux_value.addItem("All signals", None)
+        for value in values:
+            self.mux_value.addItem(f"Multiplexer = {value}", value)
+        if current in values:
+            self.mux_value.setCurrentIndex(values.index(current) + 1)
+        self.mux_value.blockSignals(False)
+        self.mux_value.setVisible(bool(values))
+        self.bit_layout.set_message(message, self.mux_value.currentData())
+
+    def _on_mux_value_changed(self, _index: int) -> None:
+        self.bit_layout.set_message(self._current_message(), self.mux_value.currentData())
 
     def _load_signals(self, message: MessageModel) -> None:
         self.signal_table.blockSignals(True)
@@ -323,6 +793,7 @@ class MainWindow(QMainWindow):
                 _pretty(signal.scale),
                 _pretty(signal.offset),
                 signal.unit,
+                _mux_text(signal),
             ]
             for col, value in enumerate(values):
                 actual_col = col if col < 3 else col + 2
@@ -368,7 +839,8 @@ class MainWindow(QMainWindow):
 
     def _on_signal_choice_changed(self, _index: int) -> None:
         self._pull_signals_from_table()
-        self.bit_layout.set_message(self._current_message())
+        self._show_bit_layout(self._current_message())
+        self._sync_data_views()
 
     def _pull_signals_from_table(self) -> None:
         message = self._current_message()
@@ -385,6 +857,10 @@ class MainWindow(QMainWindow):
             scale = _item_float(self.signal_table, row, 5, fallback=1.0)
             offset = _item_float(self.signal_table, row, 6, fallback=0.0)
             unit = _item_text(self.signal_table, row, 7, fallback="")
+            is_multiplexer, multiplexer_ids = _parse_mux(
+                _item_text(self.signal_table, row, 8, fallback="")
+            )
+            previous = message.signals[row] if row < len(message.signals) else None
             parsed.append(
                 SignalModel(
                     name=name,
@@ -398,14 +874,22 @@ class MainWindow(QMainWindow):
                     maximum=None,
                     unit=unit,
                     receivers=["Vector__XXX"],
+                    is_multiplexer=is_multiplexer,
+                    multiplexer_ids=multiplexer_ids,
+                    multiplexer_signal=previous.multiplexer_signal if previous else None,
                 )
             )
 
-        message.signals = parsed
+        multiplexers = {signal.name for signal in parsed if signal.is_multiplexer}
+        for signal in parsed:
+            if not signal.is_multiplexed or signal.multiplexer_signal not in multiplexers:
+                signal.multiplexer_signal = None
+        self.doc.set_signals(message, parsed)
 
     def _on_signal_table_changed(self, _item: QTableWidgetItem) -> None:
         self._pull_signals_from_table()
-        self.bit_layout.set_message(self._current_message())
+        self._show_bit_layout(self._current_message())
+        self._sync_data_views()
 
     def _refresh_message_list(self) -> None:
         self.message_list.blockSignals(True)
@@ -419,6 +903,7 @@ class MainWindow(QMainWindow):
             if self.current_message_index in filtered:
                 self.message_list.setCurrentRow(filtered.index(self.current_message_index))
         self.message_list.blockSignals(False)
+        self._refresh_bus_load()
 
     def _filtered_message_indices(self) -> list[int]:
         query = self.message_search.text().strip().lower()
@@ -442,21 +927,10 @@ class MainWindow(QMainWindow):
             return None
         return self.doc.messages[self.current_message_index]
 
-    def _next_frame_id(self) -> int:
-        used = {msg.frame_id for msg in self.doc.messages}
-        frame_id = 0x100
-        while frame_id in used:
-            frame_id += 1
-        return frame_id
 
-    def _unique_message_name(self, base: str) -> str:
-        used = set(self.doc.message_names())
-        if base not in used:
-            return base
-        idx = 1
-        while f"{base}{idx}" in used:
-            idx += 1
-        return f"{base}{idx}"
+def _decode_workers() -> int:
+    cpus = os.cpu_count() or 1
+    return min(4, cpus) if cpus > 1 else 0
 
 
 def _item_text(table: QTableWidget, row: int, col: int, fallback: str) -> str:
@@ -481,5 +955,29 @@ def _item_float(table: QTableWidget, row: int, col: int, fallback: float) -> flo
         return fallback
 
 
+def _mux_text(signal: SignalModel) -> str:
+    text = ""
+    if signal.is_multiplexed:
+        ranges = mux_id_ranges(signal.multiplexer_ids)
+        text = "m" + ",".join(str(lo) if lo == hi else f"{lo}-{hi}" for lo, hi in ranges)
+    return text + ("M" if signal.is_multiplexer else "")
+
+
+def _parse_mux(text: str) -> tuple[bool, Optional[list[int]]]:
+    text = text.strip()
+    is_multiplexer = text.endswith("M")
+    body = text[:-1] if is_multiplexer else text
+    if not body.startswith("m"):
+        return is_multiplexer, None
+    ids: list[int] = []
+    try:
+        for part in body[1:].split(","):
+            lo, _, hi = part.partition("-")
+            ids.extend(range(int(lo), int(hi or lo) + 1))
+    except ValueError:
+        return is_multiplexer, None
+    return is_multiplexer, sorted(set(ids)) or None
+
+
 def _pretty(value: float) -> str:
     return f"{value:.12g}"
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Optional
+import re
+import weakref
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+FIRST_FREE_FRAME_ID = 0x100
+MAX_FRAME_ID = 0x1FFFFFFF
+
+# DBC object names are C identifiers.
+_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+# Removals tolerated before the position map is rebuilt (plus a share of the messages).
+_POSITION_SLACK = 64
+
+EditListener = Callable[[str, "dict[str, Any]"], None]
 
 
 @dataclass
@@ -17,6 +30,13 @@ class SignalModel:
     maximum: Optional[float]
     unit: str
     receivers: list[str] = field(default_factory=list)
+    is_multiplexer: bool = False
+    multiplexer_ids: Optional[list[int]] = None
+    multiplexer_signal: Optional[str] = None
+
+    @property
+    def is_multiplexed(self) -> bool:
+        return self.multiplexer_ids is not None
 
 
 @dataclass
@@ -26,13 +46,452 @@ class MessageModel:
     length: int
     senders: list[str] = field(default_factory=list)
     signals: list[SignalModel] = field(default_factory=list)
+    cycle_time: Optional[int] = None
+    is_extended_frame: bool = False
+
+    def mux_values(self) -> list[int]:
+        return sorted({i for sig in self.signals for i in (sig.multiplexer_ids or [])})
+
+    def signals_for_mux(self, value: Optional[int]) -> list[SignalModel]:
+        """Signals present when the multiplexers read ``value`` (all signals for ``None``)."""
+        if value is None:
+            return list(self.signals)
+        return [
+            sig for sig in self.signals if not sig.is_multiplexed or value in sig.multiplexer_ids
+        ]
+
+    def unique_signal_name(self, base: str) -> str:
+        existing = {sig.name for sig in self.signals}
+        idx = 1
+        while f"{base}{idx}" in existing:
+            idx += 1
+        return f"{base}{idx}"
 
 
 @dataclass
 class DbcDocument:
+    """In-memory DBC database.
+
+    Frame-ID, name and position indexes are kept in sync by the mutation
+    methods below.
+    Code that edits ``messages`` (or a message's ``name``/``frame_id``)
+    directly must call :meth:`reindex` afterwards.
+
+    Listeners registered with :meth:`add_listener` are called after every
+    successful mutation with the operation name and its arguments; messages
+    are referenced by their position in ``messages``.
+
+    :meth:`snapshot` shares ``messages`` and the message objects with the
+    returned :class:`DocumentSnapshot`. While a snapshot is alive, the mutation
+    methods copy the list and each message before changing it, so a message
+    object taken from the document may be replaced by an edit; look messages
+    up again (e.g. by index) after mutating.
+    """
+
     path: Optional[str] = None
     version: Optional[str] = None
     messages: list[MessageModel] = field(default_factory=list)
+    _by_frame_id: dict[int, list[MessageModel]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _by_name: dict[str, list[MessageModel]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _free_frame_id: int = field(default=FIRST_FREE_FRAME_ID, init=False, repr=False, compare=False)
+    _name_counters: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _listeners: list[EditListener] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # id(message) -> position in ``messages`` when the map was built. Removals
+    # are recorded in the sorted ``_removed`` list instead of shifting every
+    # later entry; the map is rebuilt lazily once too many have piled up.
+    _positions: Optional[dict[int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _removed: list[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    # Copy-on-write state: live snapshots, whether ``messages`` is shared with
+    # the newest one, and ids of the private copies made since it was taken.
+    # Added messages are not trusted as private (a snapshot may hold them too);
+    # their first edit copies them as well.
+    _snapshots: weakref.WeakSet = field(
+        default_factory=weakref.WeakSet, init=False, repr=False, compare=False
+    )
+    _list_shared: bool = field(default=False, init=False, repr=False, compare=False)
+    _owned: set[int] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.reindex()
+
+    def message_names(self) -> list[str]:
+        return [msg.name for msg in self.messages]
+
+    def add_listener(self, listener: EditListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: EditListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def snapshot(self) -> DocumentSnapshot:
+        """Return a read-only view of the current state in O(1)."""
+        snap = DocumentSnapshot(path=self.path, version=self.version, messages=self.messages)
+        self._snapshots.add(snap)
+        self._list_shared = True
+        self._owned = set()
+        return snap
+
+    # -- lookups -----------------------------------------------------------
+
+    def reindex(self) -> None:
+        self._positions = None
+        self._by_frame_id = {}
+        self._by_name = {}
+        self._name_counters = {}
+        for message in self.messages:
+            self._by_frame_id.setdefault(message.frame_id, []).append(message)
+            self._by_name.setdefault(message.name, []).append(message)
+        self._free_frame_id = FIRST_FREE_FRAME_ID
+        self._advance_free_frame_id()
+
+    def message_by_frame_id(self, frame_id: int) -> Optional[MessageModel]:
+        found = self._by_frame_id.get(frame_id)
+        return found[0] if found else None
+
+    def message_by_name(self, name: str) -> Optional[MessageModel]:
+        found = self._by_name.get(name)
+        return found[0] if found else None
+
+    def index_of(self, message: MessageModel) -> int:
+        idx = self._position(message)
+        if idx is None:
+            # Stale after a direct edit of ``messages``; rebuild once.
+            self._positions = None
+            idx = self._position(message)
+        if idx is not None:
+            return idx
+        raise ValueError(f"message {message.name!r} is not part of this document")
+
+    def _position(self, message: MessageModel) -> Optional[int]:
+        if self._positions is None:
+            self._positions = {id(m): idx for idx, m in enumerate(self.messages)}
+            self._removed = []
+        base = self._positions.get(id(message))
+        if base is None:
+            return None
+        idx = base - bisect_left(self._removed, base)
+        if idx >= len(self.messages) or self.messages[idx] is not message:
+            return None
+        return idx
+
+    def next_frame_id(self) -> int:
+        """Return the lowest unused frame ID at or above ``FIRST_FREE_FRAME_ID``."""
+        if self._free_frame_id > MAX_FRAME_ID:
+            raise ValueError("no free frame ID left")
+        return self._free_frame_id
+
+    def unique_message_name(self, base: str) -> str:
+        if base not in self._by_name:
+            return base
+        idx = self._name_counters.get(base, 1)
+        while f"{base}{idx}" in self._by_name:
+            idx += 1
+        self._name_counters[base] = idx
+        return f"{base}{idx}"
+
+    # -- single mutations --------------------------------------------------
+
+    def add_message(self, message: MessageModel) -> MessageModel:
+        self._own_list()
+        self.messages.append(message)
+        if self._positions is not None:
+            self._positions[id(message)] = len(self.messages) - 1 + len(self._removed)
+        self._index_message(message)
+        self._emit("add_message", message=message)
+        return message
+
+    def remove_message(self, index: int) -> MessageModel:
+        self._own_list()
+        message = self.messages.pop(index)
+        self._forget_position(message)
+        self._unindex_message(message)
+        self._emit("remove_message", index=index)
+        return message
+
+    def update_message(
+        self,
+        message: MessageModel,
+        *,
+        name: Optional[str] = None,
+        frame_id: Optional[int] = None,
+        length: Optional[int] = None,
+        senders: Optional[list[str]] = None,
+        cycle_time: Optional[int] = None,
+    ) -> MessageModel:
+        """Change the given fields; ``cycle_time=0`` clears the cycle time."""
+        message = self._own(message)
+        changed: dict[str, Any] = {}
+        if frame_id is not None and frame_id != message.frame_id:
+            _check_frame_id(frame_id)
+            self._unindex_frame_id(message)
+            message.frame_id = frame_id
+            self._index_frame_id(message)
+            changed["frame_id"] = frame_id
+        if name is not None and name != message.name:
+            self._unindex_name(message)
+            message.name = name
+            self._by_name.setdefault(name, []).append(message)
+            changed["name"] = name
+        if length is not None and length != message.length:
+            message.length = length
+            changed["length"] = length
+        if senders is not None and list(senders) != message.senders:
+            message.senders = list(senders)
+            changed["senders"] = message.senders
+        if cycle_time is not None and (cycle_time or None) != message.cycle_time:
+            message.cycle_time = cycle_time or None
+            changed["cycle_time"] = cycle_time
+        if changed and self._listeners:
+            self._emit("update_message", index=self.index_of(message), fields=changed)
+        return message
+
+    def set_signals(self, message: MessageModel, signals: list[SignalModel]) -> None:
+        message = self._own(message)
+        message.signals = list(signals)
+        if self._listeners:
+            self._emit("set_signals", index=self.index_of(message), signals=message.signals)
+
+    def add_signal(self, message: MessageModel, signal: SignalModel) -> SignalModel:
+        message = self._own(message)
+        message.signals.append(signal)
+        if self._listeners:
+            self._emit("add_signal", index=self.index_of(message), signal=signal)
+        return signal
+
+    def remove_signal(self, message: MessageModel, index: int) -> SignalModel:
+        message = self._own(message)
+        signal = message.signals.pop(index)
+        if self._listeners:
+            self._emit("remove_signal", index=self.index_of(message), signal_index=index)
+        return signal
+
+    # -- bulk mutations ----------------------------------------------------
+
+    def add_messages(self, messages: Iterable[MessageModel]) -> list[MessageModel]:
+        added = list(messages)
+        self._own_list()
+        start = len(self.messages)
+        self.messages.extend(added)
+        if self._positions is not None:
+            start += len(self._removed)
+            self._positions.update((id(m), start + i) for i, m in enumerate(added))
+        for message in added:
+            self._by_frame_id.setdefault(message.frame_id, []).append(message)
+            self._by_name.setdefault(message.name, []).append(message)
+        self._advance_free_frame_id()
+        self._emit("add_messages", messages=added)
+        return added
+
+    def renumber_frame_ids(self, first: int, last: int, new_first: int) -> int:
+        """Move every message with a frame ID in ``first..last`` to start at ``new_first``.
+
+        Relative spacing inside the range is kept. Raises ``ValueError`` if the
+        target range collides with a message outside the source range.
+        """
+        if last < first:
+            raise ValueError("frame ID range is empty")
+        shift = new_first - first
+        _check_frame_id(first + shift)
+        _check_frame_id(last + shift)
+        moving = [m for m in self.messages if first <= m.frame_id <= last]
+        for message in moving:
+            target = message.frame_id + shift
+            if not first <= target <= last and target in self._by_frame_id:
+                raise ValueError(f"frame ID 0x{target:X} is already used")
+        moving = self._own_all(moving)
+        for message in moving:
+            self._unindex_frame_id(message, refresh_free=False)
+        for message in moving:
+            message.frame_id += shift
+            self._by_frame_id.setdefault(message.frame_id, []).append(message)
+        self._free_frame_id = FIRST_FREE_FRAME_ID
+        self._advance_free_frame_id()
+        self._emit("renumber_frame_ids", first=first, last=last, new_first=new_first)
+        return len(moving)
+
+    def rename_prefix(self, old_prefix: str, new_prefix: str) -> int:
+        """Replace ``old_prefix`` with ``new_prefix`` on every matching message name."""
+        if not old_prefix:
+            raise ValueError("prefix must not be empty")
+        moving = [m for m in self.messages if m.name.startswith(old_prefix)]
+        renamed = {m.name: new_prefix + m.name[len(old_prefix):] for m in moving}
+        for target in renamed.values():
+            _check_name(target)
+            if target in self._by_name and target not in renamed:
+                raise ValueError(f"message name {target!r} is already used")
+        moving = self._own_all(moving)
+        for message in moving:
+            self._unindex_name(message)
+        for message in moving:
+            message.name = renamed[message.name]
+            self._by_name.setdefault(message.name, []).append(message)
+        self._emit("rename_prefix", old_prefix=old_prefix, new_prefix=new_prefix)
+        return len(moving)
+
+    def move_signals(
+        self, source: MessageModel, target: MessageModel, names: Iterable[str]
+    ) -> list[SignalModel]:
+        wanted = set(names)
+        if source is target or not wanted:
+            return []
+        clashes = wanted & {sig.name for sig in target.signals}
+        if clashes:
+            raise ValueError(f"signal(s) already in {target.name}: {', '.join(sorted(clashes))}")
+        source, target = self._own_all([source, target])
+        moved = [sig for sig in source.signals if sig.name in wanted]
+        source.signals = [sig for sig in source.signals if sig.name not in wanted]
+        target.signals.extend(moved)
+        if self._listeners:
+            self._emit(
+                "move_signals",
+                source=self.index_of(source),
+                target=self.index_of(target),
+                names=[sig.name for sig in moved],
+            )
+        return moved
+
+    def _emit(self, op: str, **payload: Any) -> None:
+        for listener in list(self._listeners):
+            listener(op, payload)
+
+    # -- copy-on-write -----------------------------------------------------
+
+    def _own_list(self) -> None:
+        if self._list_shared and self._snapshots:
+            self.messages = list(self.messages)
+        self._list_shared = False
+
+    def _own(self, message: MessageModel) -> MessageModel:
+        return self._own_all([message])[0]
+
+    def _own_all(self, messages: list[MessageModel]) -> list[MessageModel]:
+        """Return ``messages`` with private copies of those a snapshot may share."""
+        if not self._snapshots:
+            return messages
+        shared = {id(message) for message in messages} - self._owned
+        if not shared:
+            return messages
+        self._own_list()
+        copies: dict[int, MessageModel] = {}
+        for message in messages:
+            if id(message) not in shared or id(message) in copies:
+                continue
+            index = self.index_of(message)
+            copied = replace(
+                message, senders=list(message.senders), signals=list(message.signals)
+            )
+            self.messages[index] = copies[id(message)] = copied
+            self._positions[id(copied)] = self._positions.pop(id(message))
+            _replace_identity(self._by_frame_id[message.frame_id], message, copied)
+            _replace_identity(self._by_name[message.name], message, copied)
+            self._owned.add(id(copied))
+        return [copies.get(id(message), message) for message in messages]
+
+    # -- index maintenance -------------------------------------------------
+
+    def _forget_position(self, message: MessageModel) -> None:
+        if self._positions is None:
+            return
+        base = self._positions.pop(id(message), None)
+        if base is None or len(self._removed) >= _POSITION_SLACK + len(self.messages) // 8:
+            self._positions = None
+        else:
+            insort(self._removed, base)
+
+    def _index_message(self, message: MessageModel) -> None:
+        self._index_frame_id(message)
+        self._by_name.setdefault(message.name, []).append(message)
+
+    def _unindex_message(self, message: MessageModel) -> None:
+        self._unindex_frame_id(message)
+        self._unindex_name(message)
+
+    def _index_frame_id(self, message: MessageModel) -> None:
+        self._by_frame_id.setdefault(message.frame_id, []).append(message)
+        if message.frame_id == self._free_frame_id:
+            self._advance_free_frame_id()
+
+    def _unindex_frame_id(self, message: MessageModel, refresh_free: bool = True) -> None:
+        frame_id = message.frame_id
+        bucket = self._by_frame_id.get(frame_id, [])
+        _remove_identity(bucket, message)
+        if bucket:
+            return
+        self._by_frame_id.pop(frame_id, None)
+        if refresh_free and FIRST_FREE_FRAME_ID <= frame_id < self._free_frame_id:
+            self._free_frame_id = frame_id
+
+    def _unindex_name(self, message: MessageModel) -> None:
+        bucket = self._by_name.get(message.name, [])
+        _remove_identity(bucket, message)
+        if not bucket:
+            self._by_name.pop(message.name, None)
+            # A freed name may be the lowest free suffix again.
+            self._name_counters.clear()
+
+    def _advance_free_frame_id(self) -> None:
+        while self._free_frame_id in self._by_frame_id:
+            self._free_frame_id += 1
+
+
+@dataclass(frozen=True, eq=False)
+class DocumentSnapshot:
+    """Read-only view of a :class:`DbcDocument` returned by :meth:`DbcDocument.snapshot`.
+
+    ``messages`` and the message objects are shared with the document (which
+    copies them before editing) and must not be modified. Safe to read from
+    another thread while the document keeps changing.
+    """
+
+    path: Optional[str]
+    version: Optional[str]
+    messages: Sequence[MessageModel]
 
     def message_names(self) -> list[str]:
         return [msg.name for msg in self.messages]
+
+
+def mux_id_ranges(ids: Iterable[int]) -> list[tuple[int, int]]:
+    """Collapse multiplexer IDs into sorted inclusive ``(low, high)`` ranges."""
+    ranges: list[tuple[int, int]] = []
+    for value in sorted(set(ids)):
+        if ranges and value == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], value)
+        else:
+            ranges.append((value, value))
+    return ranges
+
+
+def _remove_identity(items: list[MessageModel], message: MessageModel) -> None:
+    for idx, candidate in enumerate(items):
+        if candidate is message:
+            del items[idx]
+            return
+
+
+def _replace_identity(items: list[MessageModel], old: MessageModel, new: MessageModel) -> None:
+    for idx, candidate in enumerate(items):
+        if candidate is old:
+            items[idx] = new
+            return
+
+
+def _check_frame_id(frame_id: int) -> None:
+    if not 0 <= frame_id <= MAX_FRAME_ID:
+        raise ValueError(f"frame ID 0x{frame_id:X} is out of range")
+
+
+def _check_name(name: str) -> None:
+    if not _NAME_RE.fullmatch(name):
+        raise ValueError(f"message name {name!r} is not a valid DBC identifier")
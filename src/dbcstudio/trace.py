@@ -0,0 +1,32 @@
+"""Reading recorded CAN traces in ``candump -l`` log format.
+
+Each line looks like ``(1436509052.249713) can0 123#DEADBEEF``; CAN FD
+frames use ``123##1DEADBEEF`` (flags nibble after ``##``).
+"""
+
+from __future__ import annotations
+
+from typing import NamedTuple, Optional
+
+
+class Frame(NamedTuple):
+    timestamp: float
+    frame_id: int
+    data: bytes
+
+
+def parse_candump_line(line: str) -> Optional[Frame]:
+    parts = line.split()
+    if len(parts) < 3 or not parts[0].startswith("("):
+        return None
+    ident, sep, payload = parts[2].partition("#")
+    if not sep:
+        return None
+    if payload.startswith("#"):
+        payload = payload[2:]
+    elif payload.startswith("R"):
+        payload = ""
+    try:
+        return Frame(float(parts[0][1:-1]), int(ident, 16), bytes.fromhex(payload))
+    except ValueError:
+        return None
@@ -2,10 +2,21 @@ from __future__ import annotations
 
 from typing import Optional
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QPainter, QPen
-from PySide6.QtWidgets import QWidget
+import numpy as np
+from PySide6.QtCore import QLineF, QPointF, Qt
+from PySide6.QtGui import QColor, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import (
+    QComboBox,
+    QHBoxLayout,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
 
+from .busload import BITRATES, DEFAULT_BITRATE, BusLoadAnalyzer
+from .downsample import MinMaxPyramid
 from .model import MessageModel
 
 
@@ -13,10 +24,12 @@ class SignalBitLayout(QWidget):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._message: Optional[MessageModel] = None
+        self._mux_value: Optional[int] = None
         self.setMinimumHeight(220)
 
-    def set_message(self, message: Optional[MessageModel]) -> None:
+    def set_message(self, message: Optional[MessageModel], mux_value: Optional[int] = None) -> None:
         self._message = message
+        self._mux_value = mux_value
         self.update()
 
     def paintEvent(self, event) -> None:  # noqa: N802
@@ -56,7 +69,7 @@ class SignalBitLayout(QWidget):
             QColor("#6366f1"),
             QColor("#14b8a6"),
         ]
-        for idx, signal in enumerate(self._message.signals):
+        for idx, signal in enumerate(self._message.signals_for_mux(self._mux_value)):
             color = palette[idx % len(palette)]
             start = signal.start
             end = min(signal.start + signal.length - 1, 63)
@@ -75,3 +88,205 @@ class SignalBitLayout(QWidget):
             )
 
         painter.end()
+
+
+class LiveSignalView(QTableWidget):
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(0, 3, parent)
+        self.setHorizontalHeaderLabels(["Signal", "Value", "Unit"])
+        self.horizontalHeader().setStretchLastSection(True)
+        self.verticalHeader().setVisible(False)
+        self.setEditTriggers(QTableWidget.NoEditTriggers)
+        self._rows: dict[str, int] = {}
+
+    def set_message(self, message: Optional[MessageModel]) -> None:
+        signals = message.signals if message else []
+        self._rows = {signal.name: row for row, signal in enumerate(signals)}
+        self.setRowCount(len(signals))
+        for row, signal in enumerate(signals):
+            self.setItem(row, 0, QTableWidgetItem(signal.name))
+            self.setItem(row, 1, QTableWidgetItem("-"))
+            self.setItem(row, 2, QTableWidgetItem(signal.unit))
+
+    def set_values(self, values: dict[str, float]) -> None:
+        # Multiplexed signals that are not in the latest frame show "-".
+        for name, row in self._rows.items():
+            value = values.get(name)
+            self.item(row, 1).setText("-" if value is None else f"{value:.6g}")
+
+
+class BusLoadReport(QWidget):
+    """Bus load summary with the top contributing messages and sender nodes."""
+
+    TOP_MESSAGES = 15
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.bitrate = QComboBox()
+        for bitrate in BITRATES:
+            self.bitrate.addItem(f"{bitrate // 1000} kbit/s", bitrate)
+        self.bitrate.setCurrentIndex(BITRATES.index(DEFAULT_BITRATE))
+        self.summary = QLabel()
+        self.messages = self._table(["Message", "Sender", "Cycle [ms]", "Bits", "Load"])
+        self.senders = self._table(["Sender", "Load"])
+
+        header = QHBoxLayout()
+        header.addWidget(self.bitrate)
+        header.addWidget(self.summary, 1)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(header)
+        layout.addWidget(self.messages, 2)
+        layout.addWidget(self.senders, 1)
+
+    @staticmethod
+    def _table(labels: list[str]) -> QTableWidget:
+        table = QTableWidget(0, len(labels))
+        table.setHorizontalHeaderLabels(labels)
+        table.horizontalHeader().setStretchLastSection(True)
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        return table
+
+    def show_report(self, analyzer: BusLoadAnalyzer) -> None:
+        self.summary.setText(f"Worst-case bus load: {analyzer.total:.1%}")
+        top = analyzer.top_contributors(self.TOP_MESSAGES)
+        self.messages.setRowCount(len(top))
+        for row, entry in enumerate(top):
+            cycle = str(entry.cycle_time) if entry.cycle_time else "event"
+            cells = [entry.name, entry.sender, cycle, str(entry.bits), f"{entry.load:.2%}"]
+            for col, text in enumerate(cells):
+                self.messages.setItem(row, col, QTableWidgetItem(text))
+        senders = analyzer.sender_loads()
+        self.senders.setRowCount(len(senders))
+        for row, (sender, load) in enumerate(senders):
+            self.senders.setItem(row, 0, QTableWidgetItem(sender))
+            self.senders.setItem(row, 1, QTableWidgetItem(f"{load:.2%}"))
+
+
+class SignalPlot(QWidget):
+    """Time plot of one decoded signal, drawn from a min/max pyramid.
+
+    Only one min/max column per horizontal pixel is painted, so pan (drag)
+    and zoom (wheel) cost the same on 1k or 50M samples.
+    """
+
+    _MARGIN = 12
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self._pyramid: Optional[MinMaxPyramid] = None
+        self._title = ""
+        self._view = (0.0, 1.0)
+        self._drag_x: Optional[float] = None
+        self.setMinimumHeight(180)
+
+    def set_series(self, title: str, t, y) -> None:
+        self.set_pyramid(title, MinMaxPyramid(t, y))
+
+    def set_pyramid(self, title: str, pyramid: MinMaxPyramid) -> None:
+        """Show a prebuilt pyramid (e.g. from :func:`read_signal_pyramid` in a worker)."""
+        self._title = title
+        self._pyramid = pyramid if len(pyramid) else None
+        self.reset_view()
+
+    def set_title(self, title: str) -> None:
+        if title != self._title:
+            self._title = title
+            self.update()
+
+    def clear(self) -> None:
+        self._pyramid = None
+        self._title = ""
+        self.update()
+
+    def reset_view(self) -> None:
+        if self._pyramid is not None:
+            t0, t1 = self._pyramid.time_range
+            self._view = (t0, t1 if t1 > t0 else t0 + 1.0)
+        self.update()
+
+    def wheelEvent(self, event) -> None:  # noqa: N802
+        if self._pyramid is None:
+            return
+        t0, t1 = self._view
+        anchor = t0 + (t1 - t0) * self._plot_fraction(event.position().x())
+        scale = 0.8 if event.angleDelta().y() > 0 else 1.25
+        self._view = (anchor - (anchor - t0) * scale, anchor + (t1 - anchor) * scale)
+        self.update()
+
+    def mousePressEvent(self, event) -> None:  # noqa: N802
+        self._drag_x = event.position().x()
+
+    def mouseMoveEvent(self, event) -> None:  # noqa: N802
+        if self._drag_x is None or self._pyramid is None:
+            return
+        x = event.position().x()
+        t0, t1 = self._view
+        shift = (self._drag_x - x) / max(1, self.width() - 2 * self._MARGIN) * (t1 - t0)
+        self._view = (t0 + shift, t1 + shift)
+        self._drag_x = x
+        self.update()
+
+    def mouseReleaseEvent(self, event) -> None:  # noqa: N802
+        del event
+        self._drag_x = None
+
+    def mouseDoubleClickEvent(self, event) -> None:  # noqa: N802
+        del event
+        self.reset_view()
+
+    def _plot_fraction(self, x: float) -> float:
+        width = max(1, self.width() - 2 * self._MARGIN)
+        return min(1.0, max(0.0, (x - self._MARGIN) / width))
+
+    def paintEvent(self, event) -> None:  # noqa: N802
+        del event
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#ffffff"))
+        margin = self._MARGIN
+        width = max(1, self.width() - 2 * margin)
+        height = max(1, self.height() - 2 * margin - 16)
+        painter.setPen(QPen(QColor("#d8dee8")))
+        painter.drawRect(margin, margin + 16, width, height)
+
+        if self._pyramid is None:
+            painter.setPen(QColor("#64748b"))
+            painter.drawText(
+                self.rect(), Qt.AlignCenter, "Open a trace and select a signal to plot"
+            )
+            painter.end()
+            return
+
+        t0, t1 = self._view
+        cols = self._pyramid.query(t0, t1, width)
+        if len(cols.x):
+            lo = float(np.nanmin(cols.ymin))
+            hi = float(np.nanmax(cols.ymax))
+            if hi <= lo:
+                lo, hi = lo - 1.0, hi + 1.0
+            sx = width / (t1 - t0)
+            sy = height / (hi - lo)
+            xs = margin + (cols.x - t0) * sx
+            top = margin + 16 + (hi - cols.ymax) * sy
+            bottom = margin + 16 + (hi - cols.ymin) * sy
+            painter.setRenderHint(QPainter.Antialiasing, cols.raw)
+            painter.setPen(QPen(QColor("#0ea5e9"), 1))
+            painter.setClipRect(margin, margin + 16, width + 1, height + 1)
+            if cols.raw:
+                painter.drawPolyline(
+                    QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(), top.tolist())])
+                )
+            else:
+                painter.drawLines(
+                    [
+                        QLineF(x, y0, x, y1)
+                        for x, y0, y1 in zip(xs.tolist(), top.tolist(), bottom.tolist())
+                    ]
+                )
+            painter.setClipping(False)
+            painter.setPen(QColor("#64748b"))
+            painter.drawText(margin, margin + 12, f"{self._title}   [{lo:.6g} .. {hi:.6g}]")
+            span = f"{t0:.6f} s .. {t1:.6f} s  ({len(self._pyramid)} samples)"
+            painter.drawText(margin, self.height() - 2, span)
+        painter.end()
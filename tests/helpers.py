@@ -0,0 +1,23 @@
+"""Test data factories shared by the test modules."""
+
+from dbcstudio.model import SignalModel
+
+
+def make_signal(
+    name: str, start: int = 0, length: int = 8, byte_order: str = "little_endian", **fields
+) -> SignalModel:
+    """Unsigned 1:1 signal; ``fields`` overrides any other ``SignalModel`` field."""
+    values = dict(
+        name=name,
+        start=start,
+        length=length,
+        byte_order=byte_order,
+        is_signed=False,
+        scale=1.0,
+        offset=0.0,
+        minimum=None,
+        maximum=None,
+        unit="",
+    )
+    values.update(fields)
+    return SignalModel(**values)
@@ -0,0 +1,57 @@
+import pytest
+
+from dbcstudio.busload import BusLoadAnalyzer, frame_bits
+from dbcstudio.model import DbcDocument, MessageModel
+
+
+def _doc() -> DbcDocument:
+    return DbcDocument(
+        messages=[
+            MessageModel(frame_id=0x100, name="Fast", length=8, senders=["Engine"], cycle_time=10),
+            MessageModel(frame_id=0x101, name="Slow", length=8, senders=["Body"], cycle_time=100),
+            MessageModel(frame_id=0x102, name="Event", length=8, senders=["Body"]),
+            MessageModel(
+                frame_id=0x18FF0000, name="J1939", length=8, senders=["Engine"], cycle_time=20
+            ),
+        ]
+    )
+
+
+def test_frame_bits_worst_case_stuffing() -> None:
+    assert frame_bits([0, 8], [False, False]).tolist() == [55, 135]
+    assert frame_bits([0, 8], [True, True]).tolist() == [80, 160]
+
+
+def test_bus_and_sender_load() -> None:
+    analyzer = BusLoadAnalyzer(bitrate=500_000)
+    analyzer.attach(_doc())
+
+    # 135 bits every 10 ms and 100 ms, 160 bits (29-bit ID) every 20 ms.
+    fast, slow, j1939 = 135 / 5000, 135 / 50000, 160 / 10000
+    assert analyzer.total == pytest.approx(fast + slow + j1939)
+    assert analyzer.sender_loads() == [
+        ("Engine", pytest.approx(fast + j1939)),
+        ("Body", pytest.approx(slow)),
+    ]
+    assert [entry.name for entry in analyzer.top_contributors(2)] == ["Fast", "J1939"]
+
+
+def test_edits_update_load_incrementally() -> None:
+    doc = _doc()
+    analyzer = BusLoadAnalyzer()
+    analyzer.attach(doc)
+
+    preview = analyzer.what_if(2, cycle_time=5)
+    doc.update_message(doc.messages[2], cycle_time=5, senders=["Gateway"])
+    assert analyzer.total == pytest.approx(preview)
+    doc.update_message(doc.messages[0], cycle_time=0)
+    doc.remove_message(1)
+    incremental = (analyzer.total, analyzer.sender_loads())
+
+    analyzer.refresh()
+    assert incremental[0] == pytest.approx(analyzer.total)
+    assert dict(incremental[1]) == pytest.approx(dict(analyzer.sender_loads()))
+    assert "Body" not in dict(analyzer.sender_loads())
+
+    analyzer.set_bitrate(250_000)
+    assert analyzer.total == pytest.approx(2 * incremental[0])
@@ -1,6 +1,9 @@
 from pathlib import Path
 
-from dbcstudio.dbc_io import save_dbc
+import pytest
+from helpers import make_signal
+
+from dbcstudio.dbc_io import load_dbc, save_dbc
 from dbcstudio.model import DbcDocument, MessageModel, SignalModel
 
 
@@ -39,3 +42,90 @@ def test_save_dbc_writes_basic_structure(tmp_path: Path) -> None:
     assert 'VERSION "1.0"' in content
     assert "BO_ 291 VehicleStatus: 8 Gateway" in content
     assert 'SG_ Speed : 0|16@1+ (0.1,0) [0|250] "km/h" Cluster' in content
+
+
+def test_save_dbc_writes_multiplexer_indicators(tmp_path: Path) -> None:
+    doc = DbcDocument(
+        version="",
+        messages=[
+            MessageModel(
+                frame_id=0x200,
+                name="Diag",
+                length=8,
+                senders=["Gateway"],
+                signals=[
+                    make_signal("Mode", 0, is_multiplexer=True),
+                    make_signal("Temp", 8, multiplexer_ids=[1], multiplexer_signal="Mode"),
+                ],
+            )
+        ],
+    )
+
+    out = tmp_path / "mux.dbc"
+    save_dbc(doc, str(out))
+
+    content = out.read_text(encoding="utf-8")
+    assert " SG_ Mode M : 0|8@1+" in content
+    assert " SG_ Temp m1 : 8|8@1+" in content
+    assert "SG_MUL_VAL_ 512" not in content
+
+
+def test_extended_multiplexing_round_trips(tmp_path: Path) -> None:
+    pytest.importorskip("cantools")
+    doc = DbcDocument(
+        version="",
+        messages=[
+            MessageModel(
+                frame_id=0x200,
+                name="Diag",
+                length=8,
+                senders=["Gateway"],
+                signals=[
+                    make_signal("Mode", 0, is_multiplexer=True),
+                    make_signal(
+                        "Page",
+                        8,
+                        is_multiplexer=True,
+                        multiplexer_ids=[1],
+                        multiplexer_signal="Mode",
+                    ),
+                    make_signal("Temp", 16, multiplexer_ids=[2, 3, 4], multiplexer_signal="Mode"),
+                    make_signal("Volt", 24, multiplexer_ids=[7], multiplexer_signal="Page"),
+                ],
+            )
+        ],
+    )
+
+    out = tmp_path / "mux.dbc"
+    save_dbc(doc, str(out))
+    content = out.read_text(encoding="utf-8")
+    assert " SG_ Page m1M : 8|8@1+" in content
+    assert "SG_MUL_VAL_ 512 Temp Mode 2-4;" in content
+
+    loaded = load_dbc(str(out))
+    signals = {signal.name: signal for signal in loaded.messages[0].signals}
+    assert signals["Mode"].is_multiplexer and signals["Mode"].multiplexer_ids is None
+    assert signals["Page"].is_multiplexer and signals["Page"].multiplexer_ids == [1]
+    assert signals["Temp"].multiplexer_ids == [2, 3, 4]
+    assert signals["Volt"].multiplexer_signal == "Page"
+
+
+def test_cycle_time_and_extended_ids_round_trip(tmp_path: Path) -> None:
+    pytest.importorskip("cantools")
+    doc = DbcDocument(
+        version="",
+        messages=[
+            MessageModel(frame_id=0x100, name="Status", length=8, cycle_time=100),
+            MessageModel(frame_id=0x200, name="Diag", length=8, is_extended_frame=True),
+        ],
+    )
+
+    out = tmp_path / "timing.dbc"
+    save_dbc(doc, str(out))
+    content = out.read_text(encoding="utf-8")
+    assert 'BA_ "GenMsgCycleTime" BO_ 256 100;' in content
+    assert "BO_ 2147484160 Diag: 8" in content
+
+    status, diag = load_dbc(str(out)).messages
+    assert (status.cycle_time, status.is_extended_frame) == (100, False)
+    assert (diag.frame_id, diag.cycle_time, diag.is_extended_frame) == (0x200, None, True)
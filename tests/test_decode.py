@@ -0,0 +1,86 @@
+import pytest
+from helpers import make_signal
+
+from dbcstudio.decode import MessageDecoder, decode_key
+from dbcstudio.model import MessageModel
+
+
+def test_decode_little_and_big_endian_signals() -> None:
+    message = MessageModel(
+        frame_id=0x100,
+        name="Status",
+        length=8,
+        signals=[
+            make_signal("Speed", 0, 16, "little_endian", scale=0.1),
+            make_signal("Temp", 16, 8, "little_endian", is_signed=True, offset=-40.0),
+            make_signal("Rpm", 39, 16, "big_endian"),
+        ],
+    )
+    data = bytes([0xE8, 0x03, 0xFE, 0x00, 0x12, 0x34, 0x00, 0x00])
+
+    values = MessageDecoder(message).decode(data)
+
+    assert values["Speed"] == 100.0
+    assert values["Temp"] == -42.0
+    assert values["Rpm"] == 0x1234
+
+
+def test_decode_pads_short_payloads() -> None:
+    message = MessageModel(
+        frame_id=0x100, name="Short", length=4, signals=[make_signal("Counter", 24, 8)]
+    )
+    assert MessageDecoder(message).decode(b"\x01") == {"Counter": 0}
+
+
+def test_multiplexed_signals_use_dispatch_table() -> None:
+    mode = make_signal("Mode", 0, is_multiplexer=True)
+    temp = make_signal("Temp", 8, multiplexer_ids=[1])
+    volt = make_signal("Volt", 8, 16, scale=0.01, multiplexer_ids=[2, 3])
+    message = MessageModel(frame_id=0x300, name="Diag", length=3, signals=[mode, temp, volt])
+    decoder = MessageDecoder(message)
+
+    assert decoder.dispatch["Mode"][1] == (decoder.signals[1],)
+    assert decoder.decode(bytes([1, 42, 0])) == {"Mode": 1, "Temp": 42}
+    assert decoder.decode(bytes([3, 0x10, 0x27])) == {"Mode": 3, "Volt": 100.0}
+    assert decoder.decode(bytes([9, 1, 1])) == {"Mode": 9}
+
+    np = pytest.importorskip("numpy")
+    block = np.array([[1, 42, 0], [3, 0x10, 0x27]], dtype=np.uint8)
+    values = decoder.decode_array(block)
+    assert values["Temp"][0] == 42 and np.isnan(values["Temp"][1])
+    assert np.isnan(values["Volt"][0]) and values["Volt"][1] == 100.0
+
+
+def test_decode_array_handles_64_bit_signals() -> None:
+    np = pytest.importorskip("numpy")
+    message = MessageModel(
+        frame_id=0x100,
+        name="Wide",
+        length=8,
+        signals=[make_signal("Signed", 0, 64, "little_endian", is_signed=True)],
+    )
+    unsigned = MessageModel(
+        frame_id=0x101,
+        name="WideU",
+        length=8,
+        signals=[make_signal("Unsigned", 0, 64, "little_endian")],
+    )
+    payloads = [b"\xff" * 8, (1 << 63).to_bytes(8, "little"), (5).to_bytes(8, "little")]
+    block = np.frombuffer(b"".join(payloads), dtype=np.uint8).reshape(-1, 8)
+
+    for msg, name in ((message, "Signed"), (unsigned, "Unsigned")):
+        decoder = MessageDecoder(msg)
+        expected = [decoder.decode(payload)[name] for payload in payloads]
+        assert decoder.decode_array(block)[name].tolist() == expected
+    assert MessageDecoder(message).decode_array(block)["Signed"].tolist() == [-1.0, -(2.0**63), 5.0]
+    assert MessageDecoder(unsigned).decode_array(block)["Unsigned"][0] == float(2**64 - 1)
+
+
+def test_decode_key_ignores_fields_that_do_not_affect_decoding() -> None:
+    message = MessageModel(frame_id=0x100, name="A", length=8, signals=[make_signal("S")])
+    key = decode_key(message)
+
+    message.name, message.cycle_time, message.senders = "B", 100, ["ECU"]
+    assert decode_key(message) == key
+    message.signals = [make_signal("S", scale=2.0)]
+    assert decode_key(message) != key
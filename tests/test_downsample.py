@@ -0,0 +1,68 @@
+import threading
+
+import numpy as np
+from helpers import make_signal
+
+from dbcstudio.downsample import MinMaxPyramid, read_signal_pyramid
+from dbcstudio.model import MessageModel
+
+
+def test_query_returns_raw_samples_when_zoomed_in() -> None:
+    t = np.arange(100, dtype=float)
+    pyramid = MinMaxPyramid(t, t * 2)
+
+    cols = pyramid.query(10.0, 20.0, pixels=50)
+
+    assert cols.raw
+    assert cols.x[0] == 9.0 and cols.x[-1] == 20.0
+    assert np.array_equal(cols.ymin, cols.x * 2)
+
+
+def test_query_keeps_extremes_with_one_column_per_pixel() -> None:
+    n = 1_000_000
+    t = np.arange(n, dtype=float)
+    y = np.zeros(n)
+    y[123_457] = 5.0
+    y[876_543] = -3.0
+    pyramid = MinMaxPyramid(t, y)
+
+    cols = pyramid.query(0.0, float(n), pixels=400)
+
+    assert not cols.raw
+    assert len(cols.x) <= 400
+    assert cols.ymax.max() == 5.0
+    assert cols.ymin.min() == -3.0
+
+
+def test_multiplexed_signal_gaps_do_not_blank_columns() -> None:
+    n = 100_000
+    t = np.arange(n, dtype=float)
+    y = np.where(np.arange(n) % 2, np.nan, np.sin(t / 1000.0))
+    pyramid = MinMaxPyramid(t, y)
+
+    cols = pyramid.query(0.0, float(n), pixels=400)
+
+    assert len(pyramid) == n // 2
+    assert len(cols.x) and not np.isnan(cols.ymin).any() and not np.isnan(cols.ymax).any()
+    assert cols.ymax.max() == np.nanmax(y) and cols.ymin.min() == np.nanmin(y)
+
+
+def test_read_signal_pyramid_decodes_one_signal_in_chunks(tmp_path) -> None:
+    mode = make_signal("Mode", 0, is_multiplexer=True)
+    temp = make_signal("Temp", 8, multiplexer_ids=[1])
+    message = MessageModel(frame_id=0x300, name="Diag", length=2, signals=[mode, temp])
+    trace = tmp_path / "trace.log"
+    trace.write_text(
+        "".join(f"({i:.1f}) can0 300#{i % 2:02X}{i % 100:02X}\n" for i in range(1000)),
+        encoding="ascii",
+    )
+
+    pyramid = read_signal_pyramid(str(trace), message, "Temp", chunk_lines=64)
+
+    assert len(pyramid) == 500
+    assert pyramid.time_range == (1.0, 999.0)
+    assert pyramid.y.max() == 99.0
+
+    cancel = threading.Event()
+    cancel.set()
+    assert read_signal_pyramid(str(trace), message, "Temp", cancel=cancel) is None
@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from helpers import make_signal
+
+from dbcstudio.export import ExportError, export_signals
+from dbcstudio.model import DbcDocument, MessageModel
+
+
+def _doc() -> DbcDocument:
+    return DbcDocument(
+        messages=[
+            MessageModel(
+                frame_id=0x100,
+                name="Engine",
+                length=2,
+                signals=[make_signal("Rpm", 0, 16, scale=0.5)],
+            ),
+            MessageModel(
+                frame_id=0x200,
+                name="Body",
+                length=1,
+                signals=[make_signal("A", 0, 4, scale=0.5), make_signal("B", 4, 4, scale=0.5)],
+            ),
+        ]
+    )
+
+
+def _trace(tmp_path: Path, frames: int) -> str:
+    path = tmp_path / "trace.log"
+    with path.open("w", encoding="ascii") as handle:
+        for i in range(frames):
+            if i % 3:
+                handle.write(f"({i / 100:.6f}) can0 100#{i % 256:02X}{i // 256:02X}\n")
+            else:
+                handle.write(f"({i / 100:.6f}) can0 200#{i % 256:02X}\n")
+    return str(path)
+
+
+def test_csv_export_streams_all_chunks(tmp_path: Path) -> None:
+    trace = _trace(tmp_path, 1000)
+    seen = []
+
+    rows = export_signals(
+        _doc(), trace, str(tmp_path / "csv"), chunk_lines=64, progress=lambda d, t: seen.append(d)
+    )
+
+    assert rows == {"Body": 334, "Engine": 666}
+    lines = (tmp_path / "csv" / "Body.csv").read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "timestamp,A,B"
+    assert lines[2] == "0.029999999999999999,1.5,0"
+    assert len(lines) == 335
+    assert seen[-1] == Path(trace).stat().st_size
+
+
+def test_npz_export_matches_between_serial_and_process_pool(tmp_path: Path) -> None:
+    trace = _trace(tmp_path, 3000)
+    serial = tmp_path / "serial.npz"
+    pooled = tmp_path / "pooled.npz"
+
+    export_signals(_doc(), trace, str(serial), fmt="npz", chunk_lines=100)
+    export_signals(_doc(), trace, str(pooled), fmt="npz", chunk_lines=100, workers=2)
+
+    with np.load(serial) as a, np.load(pooled) as b:
+        assert sorted(a.files) == [
+            "Body.A",
+            "Body.B",
+            "Body.timestamp",
+            "Engine.Rpm",
+            "Engine.timestamp",
+        ]
+        for key in a.files:
+            assert np.array_equal(a[key], b[key])
+        assert np.all(np.diff(a["Engine.timestamp"]) > 0)
+        assert a["Engine.Rpm"][:2].tolist() == [0.5, 1.0]
+
+
+def test_export_reads_snapshot_not_later_edits(tmp_path: Path) -> None:
+    doc = _doc()
+    snapshot = doc.snapshot()
+    doc.update_message(doc.messages[0], name="Renamed")
+    doc.remove_message(1)
+
+    rows = export_signals(snapshot, _trace(tmp_path, 30), str(tmp_path / "csv"))
+
+    assert rows == {"Body": 10, "Engine": 20}
+    assert doc.message_names() == ["Renamed"]
+
+
+def test_export_rejects_messages_sharing_a_frame_id(tmp_path: Path) -> None:
+    doc = _doc()
+    doc.add_message(MessageModel(frame_id=0x100, name="EngineAlt", length=2))
+    trace = _trace(tmp_path, 30)
+
+    with pytest.raises(ExportError, match=r"0x100 \(Engine, EngineAlt\)"):
+        export_signals(doc, trace, str(tmp_path / "out"))
+    assert not (tmp_path / "out").exists()
+
+    rows = export_signals(doc, trace, str(tmp_path / "out"), messages=["EngineAlt", "Body"])
+    assert rows == {"EngineAlt": 20, "Body": 10}
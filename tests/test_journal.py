@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pytest
+from helpers import make_signal
+
+from dbcstudio.dbc_io import load_dbc, save_dbc
+from dbcstudio.journal import EditJournal, JournalError, journal_path, replay_journal
+from dbcstudio.model import DbcDocument, MessageModel
+
+
+def _saved_doc(tmp_path: Path) -> DbcDocument:
+    path = tmp_path / "bus.dbc"
+    doc = DbcDocument(
+        path=str(path),
+        version="1.0",
+        messages=[MessageModel(frame_id=0x100, name="Status", length=8)],
+    )
+    save_dbc(doc, str(path))
+    return doc
+
+
+def _reloaded(doc: DbcDocument) -> DbcDocument:
+    return DbcDocument(
+        path=doc.path,
+        version="1.0",
+        messages=[MessageModel(frame_id=0x100, name="Status", length=8)],
+    )
+
+
+def _edit(doc: DbcDocument) -> None:
+    doc.add_message(MessageModel(frame_id=doc.next_frame_id(), name="Extra", length=4))
+    doc.add_signal(doc.messages[0], make_signal("Speed"))
+    doc.update_message(doc.messages[0], name="VehicleStatus", frame_id=0x200)
+    doc.rename_prefix("Ex", "Aux")
+
+
+def test_replay_restores_edits(tmp_path: Path) -> None:
+    doc = _saved_doc(tmp_path)
+    journal = EditJournal(doc.path, flush_every=2)
+    journal.attach(doc)
+    _edit(doc)
+    journal.flush()
+
+    recovered = _reloaded(doc)
+    assert replay_journal(recovered, journal_path(doc.path)) == 4
+    assert recovered == doc
+    assert recovered.message_by_frame_id(0x200).signals[0].name == "Speed"
+
+
+def test_compact_keeps_state_and_ignores_torn_tail(tmp_path: Path) -> None:
+    doc = _saved_doc(tmp_path)
+    journal = EditJournal(doc.path)
+    journal.attach(doc)
+    _edit(doc)
+    journal.compact()
+    doc.remove_message(1)
+    journal.flush()
+    with open(journal.path, "a", encoding="utf-8") as handle:
+        handle.write('{"op":"remove_mess')
+
+    recovered = _reloaded(doc)
+    assert replay_journal(recovered, journal.path) == 2
+    assert recovered == doc
+
+
+def test_replay_rejects_changed_base_file(tmp_path: Path) -> None:
+    doc = _saved_doc(tmp_path)
+    journal = EditJournal(doc.path)
+    journal.attach(doc)
+    _edit(doc)
+    journal.flush()
+    Path(doc.path).write_text("changed\n", encoding="utf-8")
+
+    with pytest.raises(JournalError):
+        replay_journal(_reloaded(doc), journal.path)
+
+
+def test_replay_rejects_file_changed_before_first_flush(tmp_path: Path) -> None:
+    doc = _saved_doc(tmp_path)
+    journal = EditJournal(doc.path)
+    journal.attach(doc)
+    changed = DbcDocument(messages=[MessageModel(frame_id=0x50, name="Other", length=2)])
+    changed.messages.extend(doc.messages)
+    save_dbc(changed, doc.path)
+    doc.remove_message(0)
+    journal.flush()
+
+    with pytest.raises(JournalError):
+        replay_journal(_reloaded(doc), journal.path)
+
+
+def test_discard_restamps_after_save(tmp_path: Path) -> None:
+    doc = _saved_doc(tmp_path)
+    journal = EditJournal(doc.path)
+    journal.attach(doc)
+    _edit(doc)
+    save_dbc(doc, doc.path)
+    journal.discard()
+    doc.remove_message(1)
+    journal.flush()
+
+    recovered = load_dbc(doc.path)
+    assert replay_journal(recovered, journal.path) == 1
+    assert recovered.message_names() == doc.message_names()
@@ -0,0 +1,74 @@
+import socket
+import time
+
+from helpers import make_signal
+
+from dbcstudio.live import Frame, LiveMonitor, UdpFrameSource, decode_frame, encode_frame
+from dbcstudio.model import MessageModel
+
+
+def test_frame_round_trip() -> None:
+    frame = Frame(12.5, 0x18FF0001, b"\x01\x02\x03")
+    assert decode_frame(encode_frame(frame)) == frame
+
+
+def test_malformed_datagrams_are_dropped() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    source = UdpFrameSource(port=port)
+    monitor = LiveMonitor(source)
+    monitor.select(
+        MessageModel(frame_id=0x100, name="Status", length=1, signals=[make_signal("Counter")])
+    )
+    monitor.start()
+    try:
+        truncated = encode_frame(Frame(0.0, 0x100, b"\x07\x08"))[:-1]
+        valid = encode_frame(Frame(0.0, 0x100, b"\x2a"))
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            # Resend until the source has bound the port and seen a valid frame.
+            deadline = time.monotonic() + 2.0
+            while not monitor.latest().matched and time.monotonic() < deadline:
+                for packet in (b"\x00" * 5, truncated, valid):
+                    sender.sendto(packet, ("127.0.0.1", port))
+                time.sleep(0.02)
+
+        assert monitor.error is None and monitor.running
+        assert monitor.latest().values == {"Counter": 42}
+        assert source.dropped >= 2
+    finally:
+        monitor.stop()
+
+
+def test_ingest_decodes_newest_frame_of_selected_message() -> None:
+    monitor = LiveMonitor()
+    monitor.select(
+        MessageModel(
+            frame_id=0x100,
+            name="Status",
+            length=1,
+            signals=[make_signal("Counter")],
+        )
+    )
+
+    monitor.ingest([Frame(0.0, 0x100, bytes([n])) for n in range(10)] + [Frame(0.1, 0x200, b"x")])
+
+    snapshot = monitor.latest()
+    assert snapshot.values == {"Counter": 9}
+    assert snapshot.frames == 11
+    assert snapshot.matched == 10
+
+
+def test_stop_after_source_failure() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as taken:
+        taken.bind(("127.0.0.1", 0))
+        monitor = LiveMonitor(UdpFrameSource(port=taken.getsockname()[1]))
+        monitor.start()
+        deadline = time.monotonic() + 2.0
+        while monitor.running and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert isinstance(monitor.error, OSError)
+        monitor.stop()
+        monitor.stop()
+        assert not monitor.running
@@ -0,0 +1,30 @@
+import os
+
+import numpy as np
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from dbcstudio import main_window  # noqa: E402
+from dbcstudio.downsample import MinMaxPyramid  # noqa: E402
+
+
+def _pyramid(n: int) -> MinMaxPyramid:
+    return MinMaxPyramid(np.arange(n, dtype=float), np.zeros(n))
+
+
+def test_plot_cache_skips_pyramids_over_the_budget(monkeypatch) -> None:
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    small, large = _pyramid(1000), _pyramid(100_000)
+    monkeypatch.setattr(main_window, "PLOT_CACHE_BYTES", 3 * small.nbytes)
+    window = main_window.MainWindow()
+
+    for key in ("a", "b", "c"):
+        window._cache_pyramid((key,), small)
+    window._cache_pyramid(("big",), large)
+    assert list(window._plot_cache) == [("a",), ("b",), ("c",)]
+
+    window._cache_pyramid(("d",), small)
+    assert list(window._plot_cache) == [("b",), ("c",), ("d",)]
+    window.close()
@@ -0,0 +1,165 @@
+import pytest
+from helpers import make_signal
+
+from dbcstudio.model import DbcDocument, MessageModel
+
+
+def _message(frame_id: int, name: str, signals=None) -> MessageModel:
+    return MessageModel(frame_id=frame_id, name=name, length=8, signals=list(signals or []))
+
+
+def test_indexes_follow_add_update_and_remove() -> None:
+    doc = DbcDocument(messages=[_message(0x100, "A"), _message(0x101, "B")])
+    assert doc.next_frame_id() == 0x102
+    assert doc.message_by_frame_id(0x101).name == "B"
+
+    doc.add_message(_message(doc.next_frame_id(), "C"))
+    assert doc.next_frame_id() == 0x103
+
+    doc.remove_message(0)
+    assert doc.message_by_frame_id(0x100) is None
+    assert doc.next_frame_id() == 0x100
+
+    doc.update_message(doc.message_by_name("B"), name="B2", frame_id=0x100)
+    assert doc.message_by_name("B") is None
+    assert doc.message_by_frame_id(0x100).name == "B2"
+    assert doc.next_frame_id() == 0x101
+
+
+def test_unique_message_name_reuses_freed_suffix() -> None:
+    doc = DbcDocument()
+    for _ in range(3):
+        doc.add_message(_message(doc.next_frame_id(), doc.unique_message_name("New")))
+    assert doc.message_names() == ["New", "New1", "New2"]
+
+    doc.remove_message(1)
+    assert doc.unique_message_name("New") == "New1"
+
+
+def test_renumber_frame_ids_keeps_spacing_and_rejects_collisions() -> None:
+    doc = DbcDocument(
+        messages=[_message(0x100, "A"), _message(0x102, "B"), _message(0x300, "C")]
+    )
+    assert doc.renumber_frame_ids(0x100, 0x1FF, 0x200) == 2
+    assert [m.frame_id for m in doc.messages] == [0x200, 0x202, 0x300]
+    assert doc.next_frame_id() == 0x100
+
+    with pytest.raises(ValueError):
+        doc.renumber_frame_ids(0x200, 0x202, 0x2FE)
+    assert [m.frame_id for m in doc.messages] == [0x200, 0x202, 0x300]
+
+
+def test_rename_prefix_and_move_signals() -> None:
+    doc = DbcDocument(
+        messages=[
+            _message(0x100, "Eng_Speed", [make_signal("Rpm"), make_signal("Torque")]),
+            _message(0x101, "Eng_Temp"),
+            _message(0x102, "Body"),
+        ]
+    )
+    assert doc.rename_prefix("Eng_", "Engine_") == 2
+    assert doc.message_names() == ["Engine_Speed", "Engine_Temp", "Body"]
+    assert doc.message_by_name("Eng_Speed") is None
+
+    speed, temp = doc.messages[0], doc.messages[1]
+    moved = doc.move_signals(speed, temp, ["Torque"])
+    assert [sig.name for sig in moved] == ["Torque"]
+    assert [sig.name for sig in speed.signals] == ["Rpm"]
+    assert [sig.name for sig in temp.signals] == ["Torque"]
+
+
+@pytest.mark.parametrize("new_prefix", ["", "1", "Eng "])
+def test_rename_prefix_rejects_invalid_names(new_prefix: str) -> None:
+    doc = DbcDocument(messages=[_message(0x100, "Eng"), _message(0x101, "Eng_Temp")])
+
+    with pytest.raises(ValueError, match="valid DBC identifier"):
+        doc.rename_prefix("Eng", new_prefix)
+    assert doc.message_names() == ["Eng", "Eng_Temp"]
+
+
+def test_snapshot_is_isolated_from_later_edits() -> None:
+    doc = DbcDocument(
+        messages=[
+            _message(0x100, "A", [make_signal("S1")]),
+            _message(0x101, "B"),
+            _message(0x102, "C"),
+        ]
+    )
+    snap = doc.snapshot()
+    assert snap.messages is doc.messages
+
+    doc.update_message(doc.messages[0], name="A2", frame_id=0x200)
+    doc.add_signal(doc.messages[0], make_signal("S2"))
+    doc.rename_prefix("B", "X")
+    doc.remove_message(2)
+    doc.add_message(_message(0x300, "D"))
+
+    assert snap.message_names() == ["A", "B", "C"]
+    assert [sig.name for sig in snap.messages[0].signals] == ["S1"]
+    assert snap.messages[0].frame_id == 0x100
+    assert doc.message_names() == ["A2", "X", "D"]
+    assert doc.message_by_frame_id(0x200) is doc.messages[0]
+    assert doc.message_by_name("X") is doc.messages[1]
+    assert doc.message_by_frame_id(0x100) is None
+    # Untouched messages stay shared; edited ones are copied once.
+    before = doc.messages[0]
+    doc.add_signal(before, make_signal("S3"))
+    assert doc.messages[0] is before
+    assert snap.messages[1] is not doc.messages[1]
+
+
+def test_edits_without_live_snapshot_stay_in_place() -> None:
+    doc = DbcDocument(messages=[_message(0x100, "A")])
+    doc.snapshot()  # dropped immediately
+    message = doc.messages[0]
+    messages = doc.messages
+    doc.update_message(message, name="A2")
+    doc.add_message(_message(0x101, "B"))
+    assert doc.messages is messages and doc.messages[0] is message
+
+
+def test_readded_message_is_still_copied_on_write() -> None:
+    doc = DbcDocument(messages=[_message(0x100, "A"), _message(0x101, "B")])
+    snap = doc.snapshot()
+
+    message = doc.remove_message(0)
+    doc.add_message(message)
+    doc.update_message(doc.messages[1], name="Z")
+
+    assert snap.message_names() == ["A", "B"]
+    assert doc.message_names() == ["B", "Z"]
+    assert doc.message_by_name("Z") is doc.messages[1]
+
+
+def test_index_of_tracks_positions_across_edits() -> None:
+    doc = DbcDocument(messages=[_message(0x100 + i, f"M{i}") for i in range(5)])
+    events = []
+    doc.add_listener(lambda op, payload: events.append((op, payload.get("index"))))
+
+    doc.remove_message(1)
+    doc.add_message(_message(0x200, "New"))
+    snap = doc.snapshot()
+    doc.add_signal(doc.messages[2], make_signal("S"))
+    doc.update_message(doc.messages[4], length=4)
+
+    assert [doc.index_of(m) for m in doc.messages] == list(range(5))
+    assert events[-2:] == [("add_signal", 2), ("update_message", 4)]
+    with pytest.raises(ValueError):
+        doc.index_of(snap.messages[2])
+    doc.messages.append(_message(0x300, "Direct"))
+    assert doc.index_of(doc.messages[-1]) == 5
+
+
+def test_index_of_survives_removals_without_rebuilding() -> None:
+    doc = DbcDocument(messages=[_message(0x100 + i, f"M{i}") for i in range(1000)])
+    doc.index_of(doc.messages[0])
+    positions = doc._positions
+
+    for step in range(60):
+        doc.remove_message((step * 37) % len(doc.messages))
+        if step % 10 == 0:
+            doc.add_message(_message(0x1000 + step, f"N{step}"))
+    doc.add_messages([_message(0x2000, "Bulk1"), _message(0x2001, "Bulk2")])
+
+    assert doc._positions is positions
+    assert [doc.index_of(m) for m in doc.messages] == list(range(len(doc.messages)))
@@ -0,0 +1,10 @@
+from dbcstudio.trace import Frame, parse_candump_line
+
+
+def test_parse_candump_line() -> None:
+    assert parse_candump_line("(1.500000) can0 123#DEADBEEF\n") == Frame(
+        1.5, 0x123, bytes.fromhex("DEADBEEF")
+    )
+    assert parse_candump_line("(2.0) can0 18FF0001##1AABB") == Frame(2.0, 0x18FF0001, b"\xaa\xbb")
+    assert parse_candump_line("(3.0) can0 123#R") == Frame(3.0, 0x123, b"")
+    assert parse_candump_line("garbage") is None
@@ -0,0 +1,34 @@
+import os
+
+import numpy as np
+import pytest
+from helpers import make_signal
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from dbcstudio.decode import MessageDecoder  # noqa: E402
+from dbcstudio.model import MessageModel  # noqa: E402
+from dbcstudio.widgets import SignalPlot  # noqa: E402
+
+
+def test_signal_plot_draws_multiplexed_signal() -> None:
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    mode = make_signal("Mode", 0, is_multiplexer=True)
+    temp = make_signal("Temp", 8, multiplexer_ids=[1])
+    message = MessageModel(frame_id=0x300, name="Diag", length=2, signals=[mode, temp])
+    n = 50_000
+    payloads = np.zeros((n, 2), dtype=np.uint8)
+    payloads[::2, 0] = 1
+    payloads[:, 1] = np.arange(n) % 200
+    values = MessageDecoder(message).decode_array(payloads)["Temp"]
+    assert np.isnan(values[1::2]).all()
+
+    plot = SignalPlot()
+    plot.resize(400, 200)
+    plot.set_series("Temp", np.arange(n, dtype=float), values)
+    image = plot.grab().toImage()
+    app.processEvents()
+
+    drawn = {image.pixelColor(x, y).name() for x in range(0, 400, 2) for y in range(30, 190, 2)}
+    assert "#0ea5e9" in drawn